@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+import sys
+import time
+
+from fin import Transaction
+from fin import TransactionsColumns
+from fin import query
+from fin.transaction.columns_mask import query_mask
+
+from bench_parse import generate_lines
+from bench_query import QUERIES
+
+
+def measure(f):
+    start = time.perf_counter()
+    f()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    columns = TransactionsColumns(Transaction(line) for line in generate_lines(count))
+    print('transactions: {}'.format(count))
+    for text in QUERIES:
+        compiled = query(text)
+        rows = measure(lambda: [t for t in columns if compiled(t)])
+        query_mask(compiled, columns)
+        masks = measure(lambda: query_mask(compiled, columns))
+        print(text)
+        print('    per row: {:.2f}s'.format(rows))
+        print('    masks:   {:.3f}s'.format(masks))
+        print('    speedup: {:.0f}x'.format(rows / masks))
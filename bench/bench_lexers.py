@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+import sys
+import time
+
+from fin.query.parse_date import Parser
+from fin.query.query_parser import QueryParser
+from fin.transaction.transaction_parser import TagsParser
+
+
+def or_chain(count):
+    """
+    query like ones built by TagsHierarchy from many tags
+    """
+    return '({}) or (root and ({}))'.format(
+        ' or '.join('tag{}'.format(i) for i in range(count)),
+        ' or '.join('child{}'.format(i) for i in range(count))
+    )
+
+
+def tags(count):
+    return ' '.join('tag{}(parameter {})'.format(i, i) for i in range(count))
+
+
+def date(count):
+    return ' '.join(['jan 15 monday'] * count)
+
+
+INPUTS = (
+    ('query', or_chain, lambda text: QueryParser().run(text)),
+    ('tags', tags, lambda text: TagsParser().run(text)),
+    ('date', date, lambda text: Parser().parse(text)),
+)
+
+
+def measure(f, text):
+    start = time.perf_counter()
+    f(text)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    # for linear lexers and parsers time grows as much as input
+    for name, generate, parse in INPUTS:
+        small = generate(count)
+        big = generate(count * 4)
+        small_time = measure(parse, small)
+        big_time = measure(parse, big)
+        print('{}: {} characters {:.3f}s, {} characters {:.3f}s, {:.1f}x slower'.format(
+            name, len(small), small_time, len(big), big_time, big_time / small_time
+        ))
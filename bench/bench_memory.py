@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+from collections import OrderedDict
+from collections import defaultdict
+import sys
+import tracemalloc
+
+from fin import Transaction
+
+from bench_parse import generate_lines
+
+
+class LegacyMoney:
+    """
+    Layout of Money before slots: object with __dict__ and defaultdict
+    """
+    def __init__(self, amounts):
+        self._amounts = defaultdict(lambda: 0, amounts)
+
+
+class LegacyTransaction:
+    """
+    Layout of Transaction before slots: object with __dict__ and OrderedDict of tags
+    """
+    def __init__(self, date, tags, money):
+        self.date = date
+        self.tags = tags
+        self.money = money
+
+
+def legacy_transaction(line):
+    transaction = Transaction(line)
+    return LegacyTransaction(
+        transaction.date,
+        OrderedDict(transaction.tags.items()),
+        LegacyMoney(dict(transaction.money._items()))
+    )
+
+
+def measure(f, lines):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    transactions = [f(line) for line in lines]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(transactions)
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    lines = list(generate_lines(count))
+    before = measure(legacy_transaction, lines)
+    after = measure(Transaction, lines)
+    print('lines: {}'.format(count))
+    print('before: {:.0f} bytes per transaction'.format(before))
+    print('after:  {:.0f} bytes per transaction'.format(after))
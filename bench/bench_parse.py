@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+import random
+import sys
+import time
+
+from fin.transaction.transaction_parser import parse_transaction
+from fin.transaction.transaction_parser import parse_any_transaction
+
+
+TAGS = ('food', 'rent', 'shared', 'itunes', 'entertainment', 'spiders', 'tv')
+CURRENCIES = ('€', 'zł', '$', ' zł')
+
+
+def generate_lines(count, seed=0):
+    r = random.Random(seed)
+    for i in range(count):
+        yield '2016-{:02d}-{:02d} {} {},{:02d}{}'.format(
+            r.randint(1, 12), r.randint(1, 28),
+            ' '.join(r.sample(TAGS, r.randint(1, 3))),
+            r.randint(0, 1000), r.randint(0, 99), r.choice(CURRENCIES)
+        )
+
+
+def measure(f, lines):
+    start = time.perf_counter()
+    for line in lines:
+        f(line)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    lines = list(generate_lines(count))
+    slow = measure(parse_any_transaction, lines)
+    fast = measure(parse_transaction, lines)
+    print('lines: {}'.format(count))
+    print('parse_any_transaction: {:.2f}s'.format(slow))
+    print('parse_transaction:     {:.2f}s'.format(fast))
+    print('speedup:               {:.1f}x'.format(slow / fast))
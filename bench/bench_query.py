@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+import sys
+import time
+
+from fin import Transaction
+from fin import query
+
+from bench_parse import generate_lines
+
+
+QUERIES = (
+    'food and not shared',
+    'rent or tv = foo or currency = zł',
+    'food and currency = € and date >= 2016-07-01',
+)
+
+
+def measure(f, transactions):
+    start = time.perf_counter()
+    for transaction in transactions:
+        f(transaction)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    transactions = [Transaction(line) for line in generate_lines(count)]
+    print('transactions: {}'.format(count))
+    for text in QUERIES:
+        compiled = query(text)
+        tree = measure(compiled.tree, transactions)
+        function = measure(compiled, transactions)
+        print(text)
+        print('    tree:     {:.2f}s'.format(tree))
+        print('    compiled: {:.2f}s'.format(function))
+        print('    speedup:  {:.1f}x'.format(tree / function))
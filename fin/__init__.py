@@ -1,6 +1,9 @@
 from .transaction.transaction import Transaction
 from .transaction.transactions import Transactions
+from .transaction.transactions_columns import TransactionsColumns
 from .transaction.grouped_transactions import GroupedTransactions
+from .transaction.transactions_parser import iter_transactions
+from .transaction.transactions_loader import TransactionsLoader
 from .transaction.transaction import Transaction
 from .money import Money
 from .money import GroupedMoney
@@ -11,4 +14,6 @@ from .exceptions import ParseError
 from .exceptions import MoneyParseError
 from .exceptions import TransactionParseError
 from .exceptions import QueryParseError
+from .exceptions import RatesError
+from .exceptions import MissingRatesError
 from .tags_hierarchy import TagsHierarchy
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""
+Sets of rows of collection kept as ints with nth bit set
+when nth row is in the set
+"""
+
+
+def full(size):
+    return (1 << size) - 1
+
+
+def from_rows(rows, size):
+    bits = bytearray(size // 8 + 1)
+    for row in rows:
+        bits[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(bits, 'little')
+
+
+def iter_rows(bitmap):
+    """
+    yields rows set in bitmap in ascending order
+    """
+    # finding ones in reversed binary representation
+    # is faster than testing each bit separately
+    bits = format(bitmap, 'b')[::-1]
+    row = bits.find('1')
+    while row != -1:
+        yield row
+        row = bits.find('1', row + 1)
+
+
+def matching(predicate, items, within):
+    """
+    bitmap of rows of items for which predicate is true,
+    predicate is evaluated only for rows in within bitmap
+    """
+    return from_rows(
+        (row for row in iter_rows(within) if predicate(items[row])),
+        len(items)
+    )
@@ -11,3 +11,14 @@ class TransactionParseError(ParseError):
 
 class QueryParseError(Exception):
     pass
+
+
+class RatesError(Exception):
+    pass
+
+
+class MissingRatesError(RatesError):
+    """
+    provider works, but has no rates for the date
+    """
+    pass
@@ -60,20 +60,26 @@ class GroupedFunctor:
 
 
 class GroupedMonoid:
+    def accumulator(self):
+        return self.zero()
+
+    def freeze(self, accumulated):
+        return accumulated
+
     def __add__(self, other):
-        result = defaultdict(self.zero)
+        result = defaultdict(self.accumulator)
         for group, amount in self.items():
             result[group] += amount
         for group, amount in other.items():
             result[group] += amount
-        return self.__class__(dict(result))
+        return self.__class__({k: self.freeze(v) for k, v in result.items()})
 
 
 class GroupedCommutativeMonoid(GroupedMonoid):
     def __sub__(self, other):
-        result = defaultdict(self.zero)
+        result = defaultdict(self.accumulator)
         for group, amount in self.items():
             result[group] += amount
         for group, amount in other.items():
             result[group] -= amount
-        return self.__class__(dict(result))
+        return self.__class__({k: self.freeze(v) for k, v in result.items()})
@@ -0,0 +1,99 @@
+from threading import RLock
+
+
+class InternTable:
+    """
+    Table of strings where equal strings are one object, each string
+    has also integer id (its position in strings) and lowered version.
+    Table with max_size is emptied when intern or lower would grow it
+    past max_size, so only ids of table without max_size are kept forever.
+    Table is safe to use from many threads.
+    """
+    def __init__(self, max_size=None):
+        self.max_size = max_size
+        self.strings = []
+        self.ids = {}
+        self._lowered = {}
+        self._lock = RLock()
+
+    def __len__(self):
+        return len(self.strings)
+
+    def __contains__(self, text):
+        return text in self.ids
+
+    def intern(self, text):
+        """
+        returns the object from table equal to text
+        """
+        with self._lock:
+            if text not in self.ids and self._is_full():
+                self.clear()
+            return self.strings[self.index(text)]
+
+    def index(self, text):
+        """
+        returns id of text, adds text to table if it is not there yet
+        """
+        with self._lock:
+            try:
+                return self.ids[text]
+            except KeyError:
+                self.ids[text] = len(self.strings)
+                self.strings.append(text)
+                return self.ids[text]
+
+    def lower(self, text):
+        with self._lock:
+            try:
+                return self._lowered[text]
+            except KeyError:
+                if self._is_full():
+                    self.clear()
+                lowered = self._lowered[text] = self.intern(text.lower())
+                return lowered
+
+    def clear(self):
+        with self._lock:
+            self.strings = []
+            self.ids = {}
+            self._lowered = {}
+
+    def _is_full(self):
+        return self.max_size is not None and len(self.strings) + len(self._lowered) >= self.max_size
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = RLock()
+
+
+MAX_SIZE = 100000
+table = InternTable(MAX_SIZE)
+
+
+def setup_intern_table(new_table):
+    """
+    new_table: InternTable used by parsers from now on,
+        or None to stop interning
+    returns previously used table
+    """
+    global table
+    previous, table = table, new_table
+    return previous
+
+
+def intern_string(text):
+    if table is None:
+        return text
+    return table.intern(text)
+
+
+def lower_string(text):
+    if table is None:
+        return text.lower()
+    return table.lower(text)
@@ -1,18 +1,20 @@
 # -*- coding: utf-8 -*-
 from collections import defaultdict
-try:
-    from urllib import request
-    from urllib import error
-except ImportError:
-    pass
-try:
-    import requests
-except:
-    pass
+from concurrent.futures import ThreadPoolExecutor
 import datetime
-import pickle
-import json
-import atexit
+import os
+import sqlite3
+import time
+
+from .rate_providers import RatesProvider
+from .rate_providers import DictProvider
+from .rate_providers import FileProvider
+from .rate_providers import HttpProvider
+from .rate_providers import ChainedProvider
+from .rate_timeline import RateTimeline
+from .rates_store import RatesStore
+from ..exceptions import MissingRatesError
+from ..exceptions import RatesError
 
 
 currencies_aliases = {
@@ -22,33 +24,97 @@ currencies_aliases = {
 
 cache = {}
 cache_path = None
+store = None
+# dates, which rates were copied from store to cache
+_loaded_dates = set()
+provider = HttpProvider()
+# rates of all currencies are downloaded and cached in this one
+REFERENCE_CURRENCY = 'EUR'
+# number of rates downloaded at once by prefetch
+PREFETCH_WORKERS = 8
+# days rates can be used for after they were quoted
+max_staleness = 3
+# seconds rates of day without quotes, taken from earlier days,
+# are used before provider is asked for that day again
+stale_ttl = 60 * 60
+timeline = RateTimeline(max_staleness)
+_timeline_cache = None
+# {date_key: (time they were found at, rates)} of days without quotes,
+# kept only in memory, so quote published later is used
+_stale_rates = {}
+
+
+def setup_provider(new_provider):
+    """
+    Replaces provider of conversion rates, returns the previous one.
+    Rates already in cache are still used.
+    """
+    global provider
+    previous = provider
+    provider = new_provider
+    return previous
 
 
 def setup_cache(path):
-    global cache_path
+    """
+    Keeps rates in SQLite database at path, so they are downloaded
+    only once. Path of JSON file written by older versions can be given,
+    database is then next to it (.sqlite instead of .json) and rates
+    from the file are copied to it when it's created. If database can't
+    be opened, rates are cached only in memory.
+    """
+    global cache_path, store
     cache_path = path
+    if store is not None:
+        store.close()
+    store = None
+    _loaded_dates.clear()
     if not cache_path:
         return
     try:
-        _load_cache()
-    except Exception:
-        pass
+        store = RatesStore(_store_path(cache_path))
+    except (sqlite3.Error, OSError):
+        # rates are then kept only in memory, like when writing cache failed
+        return
+    if store.path != cache_path and os.path.exists(cache_path) and not len(store):
+        try:
+            store.import_json(cache_path)
+        except (ValueError, OSError):
+            pass
 
 
-def _load_cache():
-    global cache
-    with open(cache_path, 'r', encoding='utf-8') as f:
-        cache = json.loads(f.read())
+def _store_path(path):
+    root, extension = os.path.splitext(path)
+    if extension == '.json':
+        return root + '.sqlite'
+    return path
 
 
-def _save_cache():
-    if not cache_path:
-        return
-    with open(cache_path, 'w', encoding='utf-8') as f:
-        f.write(json.dumps(cache))
+def compact_cache():
+    if store is not None:
+        store.compact()
 
 
-atexit.register(_save_cache)
+def _load_stored_rates(date):
+    """
+    copies rates from store to cache, of date and max_staleness
+    days before it, once for each date
+    """
+    date_key = date.strftime('%F')
+    if store is None or date_key in _loaded_dates:
+        return
+    _get_timeline()
+    _loaded_dates.add(date_key)
+    start_key = (date - datetime.timedelta(days=max_staleness)).strftime('%F')
+    for stored_key, base, rates in store.range(start_key, date_key):
+        if base.startswith('~'):
+            # stale rates stored by earlier versions aren't quotes
+            continue
+        tables = cache.setdefault(stored_key, {})
+        if base not in tables:
+            tables[base] = rates
+            if base == REFERENCE_CURRENCY:
+                timeline.add(datetime.datetime.strptime(stored_key, '%Y-%m-%d'), rates)
 
 
 def convert(amount, from_currency, to_currency, date=None):
@@ -56,51 +122,209 @@ def convert(amount, from_currency, to_currency, date=None):
     to_currency = currencies_aliases.get(to_currency, to_currency)
     if from_currency == to_currency:
         return amount
-    rates = _get_rates(from_currency, date)
-    try:
-        return amount * rates[to_currency]
-    except KeyError:
-        raise Exception("Currency '{}' is not supported by fixer.io".format(to_currency))
+    return amount * _get_rate(from_currency, to_currency, date)
 
 
-def _get_rates(base, date=None):
-    base = currencies_aliases.get(base, base)
+def _get_rate(from_currency, to_currency, date=None):
+    """
+    Rate is derived from rates of both currencies in reference currency,
+    so one table per date covers every pair of currencies.
+    Tables cached per base currency by older versions are used
+    when they have the rate.
+    """
     date = date or datetime.date.today()
     date_key = date.strftime('%F')
-    try:
-        return cache[date_key][base]
-    except KeyError:
-        rates = _get_fixer_rates(base, date)
-        cache.setdefault(date_key, {})[base] = rates
-        return rates
+    _load_stored_rates(date)
+    rate = _get_cached_rate(date_key, from_currency, to_currency)
+    if rate is not None:
+        return rate
+    rates = _get_reference_rates(date)
+    for currency in (from_currency, to_currency):
+        if currency != REFERENCE_CURRENCY and currency not in rates:
+            raise RatesError("No conversion rates of currency '{}' at date: '{}'".format(currency, date_key))
+    return _rate_in_reference(rates, to_currency) / _rate_in_reference(rates, from_currency)
+
+
+def _get_cached_rate(date_key, from_currency, to_currency):
+    return cache.get(date_key, {}).get(from_currency, {}).get(to_currency)
 
 
-def _get_fixer_rates(base, date):
-    url = _prepare_fixer_url(base, date)
+def _rate_in_reference(rates, currency):
+    if currency == REFERENCE_CURRENCY:
+        return 1
+    return rates[currency]
+
+
+def _get_reference_rates(date):
+    """
+    Returns {currency: rate} in reference currency at date. Rates of date
+    are asked for first, only when provider has none for it (weekends,
+    holidays), rates of the nearest earlier quoted days are used,
+    until stale_ttl passes.
+    """
+    date_key = date.strftime('%F')
+    _load_stored_rates(date)
+    tables = cache.get(date_key, {})
+    if REFERENCE_CURRENCY in tables:
+        return tables[REFERENCE_CURRENCY]
+    rates = _get_recent_stale_rates(date_key)
+    if rates is not None:
+        return rates
     try:
-        response = requests.get(url)
-        response_data = response.json()
-        if response.status_code != 200:
-            _raise_coldnt_download_rates_exception(base, date, response.status_code, response.json()['error'])
-    except Exception:
+        rates = provider.rates(date)
+    except MissingRatesError:
+        return _get_stale_rates(date)
+    return _store_rates(date_key, REFERENCE_CURRENCY, rates)
+
+
+def _get_stale_rates(date):
+    """
+    Returns rates of each currency from the nearest earlier quoted day,
+    not older than max_staleness days, and keeps them in memory for date
+    for stale_ttl seconds, so they aren't looked for again.
+    """
+    for days in range(1, max_staleness + 1):
+        earlier = date - datetime.timedelta(days=days)
+        if REFERENCE_CURRENCY in cache.get(earlier.strftime('%F'), {}):
+            break
         try:
-            response = request.urlopen(url)
-            response_data = json.loads(response.read().decode('utf-8'))
-        except error.HTTPError as e:
-            _raise_coldnt_download_rates_exception(base, date, e.code, json.loads(e.read().decode('utf-8'))['error'])
-    return response_data['rates']
+            _store_rates(earlier.strftime('%F'), REFERENCE_CURRENCY, provider.rates(earlier))
+            break
+        except MissingRatesError:
+            pass
+    else:
+        raise MissingRatesError(
+            "No conversion rates at date: '{}' and {} days before it".format(
+                date.strftime('%F'), max_staleness
+            )
+        )
+    timeline = _get_timeline()
+    rates = {}
+    for currency in timeline.currencies():
+        rate = timeline.rate(currency, date, max_staleness)
+        if rate is not None:
+            rates[currency] = rate
+    _stale_rates[date.strftime('%F')] = (time.monotonic(), rates)
+    return rates
 
 
-def _prepare_fixer_url(base, date):
-    date = date.strftime('%F') if date else 'latest'
-    return 'http://api.fixer.io/{date}?base={base}'.format(
-        date=date, base=base
-    )
+def _get_recent_stale_rates(date_key):
+    """
+    returns stale rates of date_key found less than stale_ttl seconds ago
+    """
+    _get_timeline()
+    found = _stale_rates.get(date_key)
+    if found is None or time.monotonic() - found[0] >= stale_ttl:
+        return None
+    return found[1]
 
 
-def _raise_coldnt_download_rates_exception(base, date, code, message):
-    raise Exception(
-        "Couldn't download conversion rates for base: '{}' at date: '{}', because: [{}] {}".format(
-            base, date, code, message
+def _get_timeline():
+    """
+    returns timeline of quoted rates in reference currency from cache,
+    built again when cache is replaced
+    """
+    global timeline, _timeline_cache
+    if _timeline_cache is not cache:
+        timeline = RateTimeline(max_staleness)
+        timeline.load(
+            (datetime.datetime.strptime(date_key, '%Y-%m-%d'), tables[REFERENCE_CURRENCY])
+            for date_key, tables in cache.items() if REFERENCE_CURRENCY in tables
         )
+        _timeline_cache = cache
+        _loaded_dates.clear()
+        _stale_rates.clear()
+    return timeline
+
+
+def _store_rates(date_key, key, rates):
+    """
+    caches table of rates, quotes in reference currency
+    are also stored and added to timeline
+    """
+    timeline = _get_timeline()
+    cache.setdefault(date_key, {})[key] = rates
+    if key == REFERENCE_CURRENCY:
+        if store is not None:
+            store.put(date_key, key, rates)
+        timeline.add(datetime.datetime.strptime(date_key, '%Y-%m-%d'), rates)
+    return rates
+
+
+def _fetch_quoted_rates(date):
+    """
+    returns rates of date from provider, None if it has none for date
+    """
+    try:
+        return provider.rates(date)
+    except MissingRatesError:
+        return None
+
+
+def prefetch(pairs, to_currency=None, workers=PREFETCH_WORKERS):
+    """
+    Downloads rates needed to convert currencies from (date, currency)
+    pairs to to_currency that aren't cached yet at once, so converting
+    many amounts doesn't wait for each of them in turn. One table
+    of rates is downloaded for each date. Rates that were downloaded
+    are cached even if some dates failed, RatesError is raised then.
+    """
+    to_currency = currencies_aliases.get(to_currency, to_currency)
+    missing = {}
+    for date, base in pairs:
+        base = currencies_aliases.get(base, base)
+        date = date or datetime.date.today()
+        date_key = date.strftime('%F')
+        if base == to_currency or date_key in missing:
+            continue
+        _load_stored_rates(date)
+        tables = cache.get(date_key, {})
+        if (
+            REFERENCE_CURRENCY not in tables and
+            _get_recent_stale_rates(date_key) is None and
+            _get_cached_rate(date_key, base, to_currency) is None
+        ):
+            missing[date_key] = date
+    if not missing:
+        return
+    with ThreadPoolExecutor(min(workers, len(missing))) as executor:
+        futures = {
+            date_key: executor.submit(_fetch_quoted_rates, date)
+            for date_key, date in missing.items()
+        }
+    errors = []
+    unquoted = []
+    for date_key, future in futures.items():
+        try:
+            rates = future.result()
+        except RatesError as e:
+            errors.append(e)
+            continue
+        if rates is None:
+            unquoted.append(date_key)
+        else:
+            _store_rates(date_key, REFERENCE_CURRENCY, rates)
+    # days without quotes need rates of days before them
+    for date_key in sorted(unquoted):
+        try:
+            _get_reference_rates(missing[date_key])
+        except RatesError as e:
+            errors.append(e)
+    if errors:
+        raise RatesError("Couldn't prefetch conversion rates of {} dates, first error: {}".format(
+            len(errors), errors[0]
+        ))
+
+
+def prefetch_transactions(transactions, to_currency):
+    """
+    prefetches rates needed to convert transactions to to_currency
+    """
+    prefetch(
+        (
+            (transaction.date, currency)
+            for transaction in transactions
+            for currency in transaction.money.currencies()
+        ),
+        to_currency
     )
@@ -1,4 +1,6 @@
 from .money import Money
+from .money import MoneyAccumulator
+from .money_aggregation import sum_money
 from ..grouped import Grouped, GroupedFunctor, GroupedCommutativeMonoid
 
 
@@ -7,8 +9,16 @@ class GroupedMoney(Grouped, GroupedFunctor, GroupedCommutativeMonoid):
     def zero():
         return Money()
 
+    @staticmethod
+    def accumulator():
+        return MoneyAccumulator()
+
+    @staticmethod
+    def freeze(accumulated):
+        return accumulated.freeze()
+
     def money(self):
         return self.values()
 
     def sum(self):
-        return sum(self.money(), Money())
+        return sum_money(self.money())
@@ -1,12 +1,17 @@
 # -*- coding: utf-8 -*-
-import re
-from collections import defaultdict
+from types import MappingProxyType
 
 from .currency import convert as convert_currency
 from .money_parser import parse_money, create_amounts
 
 
 class Money:
+    """
+    Money in the most common, single currency, is kept as currency
+    and amount, dict of amounts is created only for multiple currencies
+    """
+    __slots__ = ('_currency', '_amount', '_many')
+
     def __init__(self, amounts=None):
         """
         amounts: {currency : amount of this currency}
@@ -14,47 +19,74 @@ class Money:
             for example in cents for euro or in groszes for złoty
         """
         if isinstance(amounts, str):
-            self._amounts = parse_money(amounts)
+            amounts = parse_money(amounts)
+        if amounts and len(amounts) == 1:
+            (self._currency, self._amount), = amounts.items()
+            self._many = None
         else:
-            self._amounts = create_amounts(amounts)
+            self._currency = None
+            self._amount = 0
+            self._many = dict(amounts) if amounts else None
+
+    @classmethod
+    def single(cls, currency, amount):
+        """
+        amount: in hundredth parts of currency
+        """
+        money = cls.__new__(cls)
+        money._currency = currency
+        money._amount = amount
+        money._many = None
+        return money
+
+    def _items(self):
+        if self._many is not None:
+            return self._many.items()
+        if self._currency is None:
+            return ()
+        return ((self._currency, self._amount),)
+
+    @property
+    def _amounts(self):
+        """
+        read-only {currency: amount}, Money can't be changed through it
+        """
+        return MappingProxyType(create_amounts(self._items()))
 
     def __add__(self, other):
+        if self._currency is not None and self._currency == other._currency:
+            return Money.single(self._currency, self._amount + other._amount)
         amounts = create_amounts()
-        for currency in self._amounts:
-            amounts[currency] = amounts[currency] + self._amounts[currency]
-        for currency in other._amounts:
-            amounts[currency] = amounts[currency] + other._amounts[currency]
+        for currency, amount in self._items():
+            amounts[currency] += amount
+        for currency, amount in other._items():
+            amounts[currency] += amount
         return Money(amounts)
 
     def __sub__(self, other):
+        if self._currency is not None and self._currency == other._currency:
+            return Money.single(self._currency, self._amount - other._amount)
         amounts = create_amounts()
-        for currency in self._amounts:
-            amounts[currency] = amounts[currency] + self._amounts[currency]
-        for currency in other._amounts:
-            amounts[currency] = amounts[currency] - other._amounts[currency]
+        for currency, amount in self._items():
+            amounts[currency] += amount
+        for currency, amount in other._items():
+            amounts[currency] -= amount
         return Money(amounts)
 
     def __truediv__(self, divider):
-        amounts = create_amounts()
-        for currency in self._amounts:
-            amounts[currency] = int(self._amounts[currency] / divider)
-        return Money(amounts)
+        return Money({
+            currency: int(amount / divider) for currency, amount in self._items()
+        })
 
     def __mul__(self, multiplayer):
-        amounts = create_amounts()
-        for currency in self._amounts:
-            amounts[currency] = int(self._amounts[currency] * multiplayer)
-        return Money(amounts)
+        return Money({
+            currency: int(amount * multiplayer) for currency, amount in self._items()
+        })
 
     def __str__(self):
         return ' + '.join(
-            self._formated_amount_of_given_currency(currency)
-            for currency in self.currencies()
-        )
-
-    def _formated_amount_of_given_currency(self, currency):
-        return self._format(
-            self._amounts[currency], currency
+            self._format(amount, currency)
+            for currency, amount in sorted(self._items())
         )
 
     def __repr__(self):
@@ -74,9 +106,9 @@ class Money:
 
     def convert(self, to_currency, date=None):
         total_amount = 0
-        for from_currency, amount in self._amounts.items():
+        for from_currency, amount in self._items():
             total_amount += convert_currency(amount, from_currency, to_currency, date)
-        return Money({to_currency: int(total_amount)})
+        return Money.single(to_currency, int(total_amount))
 
     @staticmethod
     def _format(amount, currency):
@@ -88,10 +120,42 @@ class Money:
 
     @staticmethod
     def get_amount_in_reference_currency(money):
-        return money.convert('EUR')._amounts['EUR']
+        return money.convert('EUR')._amount
 
     def currencies(self):
-        return sorted(self._amounts.keys())
+        if self._many is not None:
+            return sorted(self._many)
+        if self._currency is None:
+            return []
+        return [self._currency]
 
     def amount(self, currency):
-        return self.convert(currency)._amounts[currency] / 100
+        return self.convert(currency)._amount / 100
+
+
+class MoneyAccumulator:
+    """
+    Mutable sum of money, += and -= change it in place
+    instead of creating new Money, freeze() returns the total as Money
+    """
+    __slots__ = ('_amounts',)
+
+    def __init__(self, money=None):
+        self._amounts = {}
+        if money is not None:
+            self += money
+
+    def __iadd__(self, money):
+        amounts = self._amounts
+        for currency, amount in money._items():
+            amounts[currency] = amounts.get(currency, 0) + amount
+        return self
+
+    def __isub__(self, money):
+        amounts = self._amounts
+        for currency, amount in money._items():
+            amounts[currency] = amounts.get(currency, 0) - amount
+        return self
+
+    def freeze(self):
+        return Money(self._amounts)
@@ -0,0 +1,159 @@
+from array import array
+from collections import defaultdict
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .money import Money
+from .money import MoneyAccumulator
+
+
+# for shorter sequences creating arrays costs more than it saves
+NUMPY_THRESHOLD = 1000
+INT64_MAX = 2 ** 63 - 1
+
+
+def sum_money(moneys):
+    if numpy is None:
+        accumulator = MoneyAccumulator()
+        for money in moneys:
+            accumulator += money
+        return accumulator.freeze()
+    currencies = []
+    amounts = []
+    for money in moneys:
+        for currency, amount in money._items():
+            currencies.append(currency)
+            amounts.append(amount)
+    return Money(sum_by_key(currencies, amounts))
+
+
+def sum_grouped_money(groups):
+    """
+    groups: iterable of (group, iterable of money),
+        returns {group: total money}
+    """
+    if numpy is None:
+        return {group: sum_money(moneys) for group, moneys in groups}
+    keys = []
+    amounts = []
+    totals = {}
+    for group, moneys in groups:
+        totals[group] = {}
+        for money in moneys:
+            for currency, amount in money._items():
+                keys.append((group, currency))
+                amounts.append(amount)
+    for (group, currency), amount in sum_by_key(keys, amounts).items():
+        totals[group][currency] = amount
+    return {group: Money(group_totals) for group, group_totals in totals.items()}
+
+
+def aggregate_grouped_money(items, reducer='sum'):
+    """
+    items: iterable of (group, money), consumed in single pass
+    reducer: 'sum', 'min', 'max' or 'mean', applied separately
+        to amounts of each currency in the group
+    returns {group: money}
+    """
+    try:
+        accumulate, result = REDUCERS[reducer]
+    except KeyError:
+        raise ValueError("unknown reducer '{}'".format(reducer))
+    accumulators = {}
+    for group, money in items:
+        group_accumulators = accumulators.setdefault(group, {})
+        for currency, amount in money._items():
+            group_accumulators[currency] = accumulate(
+                group_accumulators.get(currency), amount
+            )
+    return {
+        group: Money({
+            currency: result(accumulator)
+            for currency, accumulator in group_accumulators.items()
+        })
+        for group, group_accumulators in accumulators.items()
+    }
+
+
+def _truncated_division(total, count):
+    # same rounding as int(total / count) in Money.__truediv__,
+    # but without going through float
+    quotient = abs(total) // count
+    return quotient if total >= 0 else -quotient
+
+
+REDUCERS = {
+    'sum': (
+        lambda accumulator, amount: amount if accumulator is None else accumulator + amount,
+        lambda accumulator: accumulator
+    ),
+    'min': (
+        lambda accumulator, amount: amount if accumulator is None else min(accumulator, amount),
+        lambda accumulator: accumulator
+    ),
+    'max': (
+        lambda accumulator, amount: amount if accumulator is None else max(accumulator, amount),
+        lambda accumulator: accumulator
+    ),
+    'mean': (
+        lambda accumulator, amount: (amount, 1) if accumulator is None else (accumulator[0] + amount, accumulator[1] + 1),
+        lambda accumulator: _truncated_division(*accumulator)
+    ),
+}
+
+
+def sum_by_key(keys, amounts):
+    """
+    keys, amounts: sequences of the same length,
+        amounts are integers (hundredth parts of currency),
+        keys given as array of integers are used without mapping
+    returns {key: total amount of this key}
+    """
+    if numpy is not None and len(amounts) >= NUMPY_THRESHOLD:
+        int64_amounts = _int64_amounts(amounts)
+        if int64_amounts is not None:
+            return _sum_by_key_with_numpy(keys, int64_amounts)
+    totals = defaultdict(int)
+    for key, amount in zip(keys, amounts):
+        totals[key] += amount
+    return dict(totals)
+
+
+def _int64_amounts(amounts):
+    """
+    returns amounts as int64 array, or None if they or their sum
+    may not fit in int64, then Python ints are used instead
+    """
+    try:
+        amounts = numpy.asarray(amounts, dtype=numpy.int64)
+    except OverflowError:
+        return None
+    largest = max(int(amounts.max()), -int(amounts.min()))
+    if largest * len(amounts) > INT64_MAX:
+        return None
+    return amounts
+
+
+def _sum_by_key_with_numpy(keys, amounts):
+    if isinstance(keys, array):
+        key_ids = numpy.asarray(keys, dtype=numpy.int64)
+        keys_by_id = range(key_ids.max() + 1)
+    else:
+        ids = {}
+        key_ids = numpy.fromiter(
+            (ids.setdefault(key, len(ids)) for key in keys),
+            dtype=numpy.int64, count=len(amounts)
+        )
+        keys_by_id = list(ids)
+    order = numpy.argsort(key_ids, kind='stable')
+    sorted_ids = key_ids[order]
+    starts = numpy.flatnonzero(numpy.diff(sorted_ids, prepend=-1))
+    # reduceat on int64 keeps sums exact, unlike float weights of bincount
+    sums = numpy.add.reduceat(amounts[order], starts)
+    return {
+        keys_by_id[key_id]: int(total)
+        for key_id, total in zip(sorted_ids[starts].tolist(), sums.tolist())
+    }
@@ -2,6 +2,7 @@ import re
 from collections import defaultdict
 
 from ..exceptions import MoneyParseError
+from ..intern import intern_string
 
 
 def parse_money(text):
@@ -16,7 +17,7 @@ def parse_money(text):
         return int(subunit)
 
     def parse_currency(currency):
-        return currency.strip()
+        return intern_string(currency.strip())
 
     def parse_sign(sign):
         if sign:
@@ -44,6 +45,8 @@ def parse_money(text):
 
 
 def create_amounts(amounts=None):
+    # int instead of lambda keeps money picklable,
+    # so transactions can be parsed in worker processes
     if amounts:
-        return defaultdict(lambda: 0, amounts)
-    return defaultdict(lambda: 0)
+        return defaultdict(int, amounts)
+    return defaultdict(int)
@@ -0,0 +1,193 @@
+import csv
+import json
+import time
+from urllib import error
+from urllib import request
+
+from ..exceptions import MissingRatesError
+from ..exceptions import RatesError
+
+
+class RatesProvider:
+    """
+    Source of conversion rates, rates(date) returns {currency: rate}
+    of currencies in reference currency at date, or raises RatesError.
+    latency is time in seconds of the last call. Provider that failed
+    isn't asked again for retry_after seconds, RatesError is raised instead.
+    """
+    name = 'provider'
+
+    def __init__(self, retry_after=60):
+        self.latency = None
+        self.retry_after = retry_after
+        self._failure = None
+
+    @property
+    def selected(self):
+        return self
+
+    def rates(self, date):
+        failure = self._failure
+        if failure is not None and time.monotonic() - failure[0] < self.retry_after:
+            raise RatesError(
+                "Skipped conversion rates at date: '{}', because provider failed recently: {}".format(
+                    date.strftime('%F'), failure[1]
+                )
+            )
+        start = time.perf_counter()
+        try:
+            rates = self.fetch(date)
+        except MissingRatesError:
+            raise
+        except RatesError as e:
+            self._failure = (time.monotonic(), e)
+            raise
+        finally:
+            self.latency = time.perf_counter() - start
+        self._failure = None
+        return rates
+
+    def fetch(self, date):
+        raise NotImplementedError
+
+    def __repr__(self):
+        return '{}()'.format(type(self).__name__)
+
+
+class DictProvider(RatesProvider):
+    """
+    rates: {date as %Y-%m-%d: {currency: rate}}
+    """
+    name = 'dict'
+
+    def __init__(self, rates, retry_after=60):
+        super().__init__(retry_after)
+        self._rates = rates
+
+    def fetch(self, date):
+        try:
+            return self._rates[date.strftime('%F')]
+        except KeyError:
+            raise MissingRatesError("No conversion rates at date: '{}'".format(date.strftime('%F')))
+
+
+class FileProvider(DictProvider):
+    """
+    Rates read from file, when it's needed for the first time.
+    JSON file has the same structure as rates of DictProvider,
+    CSV file is like ECB history of rates: header with Date and
+    currencies, then row for each date. Empty and N/A rates are skipped.
+    """
+    name = 'file'
+
+    def __init__(self, path):
+        super().__init__(None)
+        self.path = path
+
+    def fetch(self, date):
+        if self._rates is None:
+            self._rates = self._read()
+        return super().fetch(date)
+
+    def _read(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                if self.path.endswith('.json'):
+                    return json.load(f)
+                return self._read_csv(f)
+        except (OSError, ValueError, KeyError, csv.Error) as e:
+            raise RatesError("Couldn't read conversion rates from '{}', because: {}".format(self.path, e))
+
+    @staticmethod
+    def _read_csv(f):
+        rates = {}
+        for row in csv.DictReader(f, skipinitialspace=True):
+            date = row.pop('Date')
+            rates[date] = {
+                currency.strip(): float(rate) for currency, rate in row.items()
+                if currency and rate and rate != 'N/A'
+            }
+        return rates
+
+    def __repr__(self):
+        return 'FileProvider({!r})'.format(self.path)
+
+
+class HttpProvider(RatesProvider):
+    """
+    Rates downloaded from fixer.io compatible service
+    """
+    name = 'http'
+
+    def __init__(self, url='http://api.fixer.io', base='EUR', timeout=30, retry_after=60):
+        super().__init__(retry_after)
+        self.url = url
+        self.base = base
+        self.timeout = timeout
+
+    def fetch(self, date):
+        url = '{}/{}?base={}'.format(self.url, date.strftime('%F'), self.base)
+        try:
+            with request.urlopen(url, timeout=self.timeout) as response:
+                return json.loads(response.read().decode('utf-8'))['rates']
+        except error.HTTPError as e:
+            raise self._error(date, e.code, self._message(e))
+        except (error.URLError, OSError, ValueError, KeyError) as e:
+            raise self._error(date, None, e)
+
+    @staticmethod
+    def _message(e):
+        try:
+            return json.loads(e.read().decode('utf-8'))['error']
+        except (ValueError, KeyError, TypeError):
+            return e.reason
+
+    def _error(self, date, code, message):
+        return RatesError(
+            "Couldn't download conversion rates for base: '{}' at date: '{}', because: [{}] {}".format(
+                self.base, date.strftime('%F'), code, message
+            )
+        )
+
+    def __repr__(self):
+        return 'HttpProvider({!r})'.format(self.url)
+
+
+class ChainedProvider(RatesProvider):
+    """
+    Asks providers in order until one of them has rates,
+    selected is the one that had them the last time.
+    """
+    name = 'chained'
+    selected = None
+
+    def __init__(self, *providers):
+        super().__init__()
+        self.providers = providers
+
+    def rates(self, date):
+        # each provider backs off on its own, so failure of one of them
+        # doesn't stop the chain from asking the others
+        start = time.perf_counter()
+        try:
+            return self.fetch(date)
+        finally:
+            self.latency = time.perf_counter() - start
+
+    def fetch(self, date):
+        errors = []
+        for provider in self.providers:
+            try:
+                rates = provider.rates(date)
+            except RatesError as e:
+                errors.append(e)
+                continue
+            self.selected = provider
+            return rates
+        message = '; '.join(str(e) for e in errors) or 'No providers of conversion rates'
+        if errors and all(isinstance(e, MissingRatesError) for e in errors):
+            raise MissingRatesError(message)
+        raise RatesError(message)
+
+    def __repr__(self):
+        return 'ChainedProvider({})'.format(', '.join(repr(p) for p in self.providers))
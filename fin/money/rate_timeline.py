@@ -0,0 +1,67 @@
+from bisect import bisect_left
+from bisect import bisect_right
+
+
+class RateTimeline:
+    """
+    Rates of each currency at days they were quoted at, sorted by day,
+    so rate at any day is found by binary search. Rate at day without
+    quote is the one from the nearest earlier quoted day, if it's not
+    older than max_staleness days.
+    """
+    def __init__(self, max_staleness=3):
+        self.max_staleness = max_staleness
+        self._days = {}
+        self._rates = {}
+
+    def __len__(self):
+        return len(self._days)
+
+    def __contains__(self, currency):
+        return currency in self._days
+
+    def currencies(self):
+        return list(self._days)
+
+    def add(self, date, rates):
+        """
+        adds {currency: rate} quoted at date, replacing rates
+        quoted at the same day
+        """
+        day = date.toordinal()
+        for currency, rate in rates.items():
+            days = self._days.setdefault(currency, [])
+            currency_rates = self._rates.setdefault(currency, [])
+            if days and days[-1] < day:
+                days.append(day)
+                currency_rates.append(rate)
+                continue
+            position = bisect_left(days, day)
+            if position < len(days) and days[position] == day:
+                currency_rates[position] = rate
+            else:
+                days.insert(position, day)
+                currency_rates.insert(position, rate)
+
+    def load(self, dated_rates):
+        """
+        adds rates from iterable of (date, {currency: rate})
+        """
+        for date, rates in sorted(dated_rates, key=lambda item: item[0]):
+            self.add(date, rates)
+
+    def rate(self, currency, date, max_staleness=None):
+        """
+        returns rate of currency at date or at the nearest earlier
+        quoted day, None if there is no such day in max_staleness days
+        """
+        if max_staleness is None:
+            max_staleness = self.max_staleness
+        days = self._days.get(currency)
+        if not days:
+            return None
+        day = date.toordinal()
+        position = bisect_right(days, day) - 1
+        if position < 0 or day - days[position] > max_staleness:
+            return None
+        return self._rates[currency][position]
@@ -0,0 +1,115 @@
+import json
+import os
+import sqlite3
+import sys
+from threading import Lock
+
+
+class RatesStore:
+    """
+    Tables of conversion rates kept in SQLite database, each table
+    is written as soon as it's put and read only when it's needed.
+    Database is in WAL mode and SQLite locks the file, so it can be
+    shared by many processes.
+    """
+    def __init__(self, path, timeout=30):
+        self.path = path
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS rates ('
+                'date TEXT NOT NULL, base TEXT NOT NULL, rates TEXT NOT NULL, '
+                'PRIMARY KEY (date, base))'
+            )
+
+    def __len__(self):
+        return self._query('SELECT COUNT(*) FROM rates')[0][0]
+
+    def get(self, date_key, base):
+        """
+        returns {currency: rate} of base at date_key (%Y-%m-%d)
+        or None if it isn't stored
+        """
+        rows = self._query(
+            'SELECT rates FROM rates WHERE date = ? AND base = ?', (date_key, base)
+        )
+        return json.loads(rows[0][0]) if rows else None
+
+    def range(self, start_key, end_key):
+        """
+        returns [(date_key, base, rates)] stored for dates
+        from start_key to end_key, inclusive
+        """
+        return [
+            (date_key, base, json.loads(rates))
+            for date_key, base, rates in self._query(
+                'SELECT date, base, rates FROM rates WHERE date BETWEEN ? AND ? ORDER BY date',
+                (start_key, end_key)
+            )
+        ]
+
+    def put(self, date_key, base, rates):
+        self.put_many([(date_key, base, rates)])
+
+    def put_many(self, entries):
+        """
+        entries: iterable of (date_key, base, rates), written in one transaction
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO rates VALUES (?, ?, ?)',
+                ((date_key, base, json.dumps(rates)) for date_key, base, rates in entries)
+            )
+
+    def import_json(self, path):
+        """
+        copies rates from JSON file {date_key: {base: rates}} written
+        by older versions, returns number of tables
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        entries = [
+            (date_key, base, rates)
+            for date_key, tables in cache.items()
+            for base, rates in tables.items()
+        ]
+        self.put_many(entries)
+        return len(entries)
+
+    def compact(self):
+        """
+        rebuilds database without free pages and moves WAL log to it
+        """
+        with self._lock:
+            self._connection.execute('VACUUM')
+            self._connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def _query(self, sql, parameters=()):
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchall()
+
+
+def main(argv):
+    """
+    python -m fin.money.rates_store compact path/to/rates.sqlite
+    """
+    if len(argv) != 3 or argv[1] != 'compact':
+        print(main.__doc__.strip())
+        return 2
+    path = argv[2]
+    size = os.path.getsize(path)
+    store = RatesStore(path)
+    store.compact()
+    store.close()
+    print('{}: {} -> {} bytes'.format(path, size, os.path.getsize(path)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -1,2 +1,4 @@
 from .query import query
-from .by import by
\ No newline at end of file
+from .query import Query
+from .by import by
+from .planner import plan
@@ -0,0 +1,127 @@
+from datetime import datetime
+
+from ..intern import lower_string
+from ..money import Money
+from .parse_date import parse_date
+from .query import flatten
+
+
+COMPARISONS = {
+    '<': '<',
+    '<=': '<=',
+    '=': '==',
+    '!=': '!=',
+    '>=': '>=',
+    '>': '>',
+}
+STRING_RELATIONS = {
+    '^=': '{left}.startswith({right})',
+    '*=': '({right} in {left})',
+    '$=': '{left}.endswith({right})',
+}
+LEFT_SIDES = {
+    'date': 't.date',
+    'money': 't.money',
+    'currency': "''.join(t.money.currencies())",
+}
+# answers of tag atoms remembered for each of them
+MAX_REMEMBERED = 10000
+
+
+def compile_query(node, now=None):
+    """
+    Returns function of transaction equivalent to calling node.
+    Query is translated to source of single expression, so types
+    and operators of nodes are checked only once, here, and right
+    sides of relations are parsed only once too.
+    now: datetime relative dates are resolved against, current one if None
+    """
+    return Compiler(now).run(node)
+
+
+class Compiler:
+    def __init__(self, now=None):
+        self.now = now or datetime.now()
+
+    def run(self, node):
+        self.namespace = {'in_reference_currency': Money.get_amount_in_reference_currency}
+        source = 'def query(t):\n    return {}\n'.format(self.expression(node))
+        exec(compile(source, '<query>', 'exec'), self.namespace)
+        return self.namespace['query']
+
+    def constant(self, value):
+        name = 'c{}'.format(len(self.namespace))
+        self.namespace[name] = value
+        return name
+
+    def expression(self, node):
+        if node.type == 'binary' and node.operator in ('and', 'or'):
+            # chains are kept flat, compile() allows only limited nesting
+            return '({})'.format(' {} '.format(node.operator).join(
+                self.expression(operand) for operand in flatten(node, node.operator)
+            ))
+        elif node.type == 'binary':
+            return self.relation(node)
+        elif node.type == 'unary':
+            if node.operator == 'not':
+                return '(not {})'.format(self.expression(node.right))
+            return 'None'
+        elif node.type == 'tag':
+            return '{}(t.tags.names)'.format(self.constant(has_tag(node.value)))
+        return 'None'
+
+    def relation(self, node):
+        sides = self.sides(node)
+        if sides is None:
+            return 'False'
+        left, right = sides
+        if node.operator in COMPARISONS:
+            return '({} {} {})'.format(left, COMPARISONS[node.operator], right)
+        elif node.operator in STRING_RELATIONS:
+            return STRING_RELATIONS[node.operator].format(left=left, right=right)
+        return 'None'
+
+    def sides(self, node):
+        left_type = node.left.type
+        left_value = getattr(node.left, 'value', None)
+        value = getattr(node.right, 'value', None)
+        if left_type == 'keyword' and left_value == 'date':
+            return LEFT_SIDES['date'], self.constant(parse_date(value, self.now))
+        elif left_type == 'keyword' and left_value == 'money':
+            return self.money_sides(node.operator, Money(value))
+        elif left_type == 'keyword' and left_value in LEFT_SIDES:
+            return LEFT_SIDES[left_value], self.constant(value)
+        elif left_type == 'tag':
+            return "t.tags.get({}, '')".format(self.constant(left_value)), self.constant(value)
+        return None
+
+    def money_sides(self, operator, money):
+        if operator in ('=', '!='):
+            # money is equal when its text is equal
+            return 'str(t.money)', self.constant(str(money))
+        if operator in COMPARISONS:
+            # money is ordered by amount in reference currency,
+            # right side is converted once
+            return (
+                'in_reference_currency(t.money)',
+                self.constant(Money.get_amount_in_reference_currency(money))
+            )
+        return LEFT_SIDES['money'], self.constant(money)
+
+
+def has_tag(tag):
+    """
+    returns function checking if tuple of tags names contains tag
+    ignoring case, answers are remembered for each tuple
+    """
+    answers = {}
+
+    def check(names):
+        try:
+            return answers[names]
+        except KeyError:
+            answer = tag in map(lower_string, names)
+            if len(answers) < MAX_REMEMBERED:
+                answers[names] = answer
+            return answer
+    return check
@@ -2,9 +2,33 @@ from collections import namedtuple
 from datetime import datetime, timedelta
 import calendar
 
+from ..lru_cache import LRUCache
+
+
+# dates that are the same for every time of a day, keyed by text and day
+date_cache = LRUCache(1024)
+# whether date of text depends on time, like 'now' or '2 hours ago',
+# keyed by text, such dates aren't cached
+depends_on_time = LRUCache(1024)
+
 
 def parse_date(text='', now=None):
-    return Parser(now).parse(text)
+    now = now or datetime.now()
+    key = (text, now.date())
+    date = date_cache.get(key)
+    if date is not None:
+        return date
+    date = Parser(now).parse(text)
+    time_dependent = depends_on_time.get(text)
+    if time_dependent is None:
+        # parsing again twelve hours apart shows if date depends on time,
+        # it's done once for each text
+        other_now = now + timedelta(hours=12) if now.hour < 12 else now - timedelta(hours=12)
+        time_dependent = Parser(other_now).parse(text) != date
+        depends_on_time.put(text, time_dependent)
+    if not time_dependent:
+        date_cache.put(key, date)
+    return date
 
 
 Token = namedtuple('Token', ['type', 'value'])
@@ -102,10 +126,10 @@ month_1.update({'month': 1})
 
 class Lexer:
     def tokenize(self, text):
-        self.chars = list(text.lower())
+        self.text = text.lower()
+        self.position = 0
         self.tokens = []
-        word = ''
-        while self.chars:
+        while self.position < len(self.text):
             c = self.pick()
             if c in white_space:
                 self.pop()
@@ -119,27 +143,29 @@ class Lexer:
         return self.tokens
 
     def pick(self):
-        if not self.chars:
+        if self.position >= len(self.text):
             return None
-        return self.chars[0]
+        return self.text[self.position]
 
     def pop(self):
-        return self.chars.pop(0)
+        c = self.text[self.position]
+        self.position += 1
+        return c
+
+    def read_while(self, f):
+        start = self.position
+        while self.position < len(self.text) and f(self.text[self.position]):
+            self.position += 1
+        return self.text[start:self.position]
 
     def read_number(self):
-        number = ''
-        while self.pick() and self.pick() in numbers:
-            number += self.pop()
-        self.add('number', int(number))
+        self.add('number', int(self.read_while(lambda c: c in numbers)))
 
     def read_punctuation(self):
         self.add('punctuation', self.pop())
 
     def read_word(self):
-        word = ''
-        while self.pick() and self.pick() not in word_breaks:
-            word += self.pop()
-        self.add('word', word)
+        self.add('word', self.read_while(lambda c: c not in word_breaks))
 
     def add(self, type, value):
         value = synonyms.get(value, value)
@@ -162,9 +188,10 @@ class Parser:
 
     def parse(self, text, now=None):
         self.tokens = Lexer().tokenize(text)
+        self.position = 0
         self.modifications = []
         self.date = self.now
-        while self.tokens:
+        while not self.is_eof():
             t = self.pick()
             if t.type == 'ampm':
                 self.pop()
@@ -189,21 +216,23 @@ class Parser:
         return self.date
 
     def pick(self):
-        if not self.tokens:
+        if self.is_eof():
             return empty_token
-        return self.tokens[0]
+        return self.tokens[self.position]
 
     def pickpick(self):
         try:
-            return self.tokens[1]
+            return self.tokens[self.position + 1]
         except IndexError:
             return empty_token
 
     def pop(self):
-        return self.tokens.pop(0)
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
 
     def is_eof(self):
-        return not self.tokens
+        return self.position >= len(self.tokens)
 
     def add_modification(self, modification):
         self.modifications.append(modification)
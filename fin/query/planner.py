@@ -0,0 +1,166 @@
+from copy import copy
+
+from .query import Binary
+from .query import flatten
+from .query import Query
+from .query import Unary
+from .query_parser import QueryToken
+
+
+# estimated cost of evaluating node for one transaction,
+# comparing money converts it through EUR so it's the most expensive
+ROW_COSTS = {
+    'tag': 1,
+    'tag relation': 2,
+    'currency relation': 3,
+    'date relation': 10,
+    'money relation': 50,
+}
+# rows already in index cost only few operations on bitmaps
+INDEX_COST = 0.01
+DEFAULT_SELECTIVITY = 0.5
+DEFAULT_SELECTIVITIES = {
+    'tag': 0.1,
+    '=': 0.1,
+    '!=': 0.9,
+}
+
+
+def plan(node, transactions=None, now=None):
+    """
+    Returns query equivalent to node, with operands of and/or chains
+    ordered so cheap and decisive ones are evaluated first.
+    Every node of the result has cost (per transaction), selectivity
+    (expected fraction of matching transactions) and access ('index'
+    when it's answered from indexes of transactions, 'scan' otherwise).
+    Nodes of the result are new, trees of queries are shared by cache,
+    so they are never changed.
+    transactions: used for indexes and exact selectivities of them
+    now: datetime relative dates are resolved against
+    """
+    if isinstance(node, Query):
+        node = node.tree
+    return Planner(transactions, now).plan(node)
+
+
+def explain(node, transactions=None, now=None):
+    """
+    returns text describing plan of node, one line per node
+    """
+    return '\n'.join(describe(plan(node, transactions, now)))
+
+
+def describe(node, level=0):
+    indent = '  ' * level
+    estimates = '{} (cost {:.3g}, selectivity {:.3g})'.format(
+        node.access, node.cost, node.selectivity
+    )
+    if node.type == 'binary' and node.operator in ('and', 'or'):
+        yield '{}{} {}'.format(indent, node.operator, estimates)
+        for operand in flatten(node, node.operator):
+            yield from describe(operand, level + 1)
+    elif node.type == 'unary':
+        yield '{}{} {}'.format(indent, node.operator, estimates)
+        yield from describe(node.right, level + 1)
+    else:
+        yield '{}{} {}'.format(indent, node, estimates)
+
+
+class Planner:
+    def __init__(self, transactions=None, now=None):
+        self.transactions = transactions
+        self.now = now
+        self.is_indexed = hasattr(transactions, 'tag_index')
+
+    def plan(self, node):
+        if node.type == 'binary' and node.operator in ('and', 'or'):
+            return self.plan_chain(node.operator, flatten(node, node.operator))
+        elif node.type == 'binary':
+            return self.plan_relation(node)
+        elif node.type == 'unary':
+            return self.plan_unary(node)
+        return self.plan_atom(node)
+
+    def plan_chain(self, operator, operands):
+        operands = sorted(
+            (self.plan(operand) for operand in operands),
+            key=self.and_rank if operator == 'and' else self.or_rank
+        )
+        planned = operands[0]
+        for operand in operands[1:]:
+            planned = Binary(QueryToken('operator', operator), planned, operand)
+        cost = 0
+        passing = 1
+        for operand in operands:
+            # next operand is evaluated only for rows
+            # not decided by previous operands
+            cost += passing * operand.cost
+            if operator == 'and':
+                passing *= operand.selectivity
+            else:
+                passing *= 1 - operand.selectivity
+        return annotate(
+            planned, cost,
+            passing if operator == 'and' else 1 - passing,
+            'index' if all(o.access == 'index' for o in operands) else 'scan'
+        )
+
+    def and_rank(self, node):
+        # date ranges go first, so they can be intersected with each other
+        if node.access == 'index' and is_date_relation(node) and node.operator != '!=':
+            return (0, 0)
+        if node.selectivity >= 1:
+            return (1, float('inf'))
+        return (1, node.cost / (1 - node.selectivity))
+
+    def or_rank(self, node):
+        if node.selectivity <= 0:
+            return float('inf')
+        return node.cost / node.selectivity
+
+    def plan_relation(self, node):
+        if is_date_relation(node):
+            kind = 'date relation'
+        elif node.left.type == 'keyword':
+            kind = node.left.value + ' relation'
+        else:
+            kind = 'tag relation'
+        selectivity = DEFAULT_SELECTIVITIES.get(node.operator, DEFAULT_SELECTIVITY)
+        if self.is_indexed and kind == 'date relation':
+            count = self.transactions.date_index.count(node.operator, node.date(self.now))
+            if count is not None:
+                return annotate(node, INDEX_COST, self.fraction(count), 'index')
+        return annotate(node, ROW_COSTS.get(kind, 1), selectivity, 'scan')
+
+    def plan_unary(self, node):
+        right = self.plan(node.right)
+        planned = Unary(QueryToken('operator', node.operator), right)
+        return annotate(planned, right.cost, 1 - right.selectivity, right.access)
+
+    def plan_atom(self, node):
+        if node.type != 'tag':
+            return annotate(node, 0, 0, 'index')
+        if self.is_indexed:
+            count = self.transactions.tag_index.count(node.value)
+            return annotate(node, INDEX_COST, self.fraction(count), 'index')
+        return annotate(node, ROW_COSTS['tag'], DEFAULT_SELECTIVITIES['tag'], 'scan')
+
+    def fraction(self, count):
+        if not len(self.transactions):
+            return 0
+        return count / len(self.transactions)
+
+
+def is_date_relation(node):
+    return node.type == 'binary' and node.left.type == 'keyword' and node.left.value == 'date'
+
+
+def annotate(node, cost, selectivity, access):
+    """
+    returns copy of node with estimates
+    """
+    planned = copy(node)
+    planned.cost = cost
+    planned.selectivity = selectivity
+    planned.access = access
+    return planned
@@ -1,15 +1,82 @@
 import datetime
 
+from ..bitmaps import matching
+from ..intern import lower_string
+from ..lru_cache import LRUCache
 from ..money import Money
 from .parse_date import parse_date
 
 
+# parsed trees of recently used queries, keyed by text
+query_cache = LRUCache(256)
+
+
 def query(text):
     from .query_parser import parse_query
-    return parse_query(text)
+    return Query(query_cache.get_or_compute(text, parse_query))
+
+
+class Query:
+    """
+    Parsed query compiled into single function of transaction,
+    with operands ordered by planner. Relative dates like 'today'
+    are resolved once, against now pinned when query was created.
+    """
+    def __init__(self, tree, now=None):
+        self.tree = tree
+        self.rebind(now)
+
+    def rebind(self, now=None):
+        """
+        pins now to given datetime, current one if None,
+        for example to reuse query in long running process
+        """
+        self.now = now or datetime.datetime.now()
+        # compiling resolves money and dates, so it's postponed
+        # until query is used
+        self._function = self._compile_and_call
+        return self
+
+    def _compile_and_call(self, transaction):
+        from .compiler import compile_query
+        from .planner import plan
+        self._function = compile_query(plan(self.tree, now=self.now), self.now)
+        return self._function(transaction)
+
+    def __call__(self, transaction):
+        return self._function(transaction)
+
+    def __str__(self):
+        return str(self.tree)
+
+    def select(self, transactions, within):
+        from .planner import plan
+        return plan(self.tree, transactions, self.now).select(
+            transactions, within, self.now
+        )
+
+    def explain(self, transactions=None):
+        return self.tree.explain(transactions, self.now)
 
 
-class Binary:
+class Node:
+    def compile(self, now=None):
+        """
+        returns function of transaction equivalent to calling the node
+        """
+        from .compiler import compile_query
+        return compile_query(self, now)
+
+    def explain(self, transactions=None, now=None):
+        """
+        returns description of the plan used to evaluate the query,
+        for given transactions if they are known
+        """
+        from .planner import explain
+        return explain(self, transactions, now)
+
+
+class Binary(Node):
     def __init__(self, token, left, right):
         self.type = 'binary'
         self.operator = token.value
@@ -24,6 +91,66 @@ class Binary:
         else:
             return self.relation(transaction)
 
+    def select(self, transactions, within, now=None):
+        """
+        transactions: Transactions, their indexes are used where possible
+        within: bitmap of rows to consider
+        now: datetime relative dates are resolved against
+        returns bitmap of rows matching the query
+        """
+        if self.operator == 'and':
+            # date ranges are intersected before getting rows from index,
+            # other operands are evaluated only for rows still matching
+            date_range = None
+            operands = []
+            for operand in flatten(self, 'and'):
+                operand_range = date_range_of(operand, transactions, now)
+                if operand_range is None:
+                    operands.append(operand)
+                else:
+                    date_range = intersect(date_range, operand_range)
+            if date_range is not None:
+                within &= transactions.date_index.range_bitmap(*date_range)
+            for operand in operands:
+                within = operand.select(transactions, within, now)
+            return within
+        elif self.operator == 'or':
+            selected = 0
+            for operand in flatten(self, 'or'):
+                selected |= operand.select(transactions, within & ~selected, now)
+            return selected
+        if self.is_date_relation():
+            bitmap = transactions.date_index.bitmap(self.operator, self.date(now))
+            if bitmap is not None:
+                return bitmap & within
+        return matching(self.compile(now), transactions, within)
+
+    def is_date_relation(self):
+        return self.left.type == 'keyword' and self.left.value == 'date'
+
+    def date(self, now=None):
+        """
+        right side of date relation
+        """
+        return parse_date(self.right.value, now)
+
+    def date_range(self, transactions, now=None):
+        """
+        (start, end) in date index of rows matching conjunction
+        of date relations, None if query isn't such conjunction
+        """
+        if self.operator == 'and':
+            date_range = None
+            for operand in flatten(self, 'and'):
+                operand_range = date_range_of(operand, transactions, now)
+                if operand_range is None:
+                    return None
+                date_range = intersect(date_range, operand_range)
+            return date_range
+        if not self.is_date_relation():
+            return None
+        return transactions.date_index.range(self.operator, self.date(now))
+
     def relation(self, transaction):
         left_side, right_side = self.calculate_sides(transaction)
         if left_side is None and right_side is None:
@@ -68,7 +195,35 @@ class Binary:
         return '({} {} {})'.format(self.left, self.operator, self.right)
 
 
-class Unary:
+def flatten(node, operator):
+    """
+    operands of chain of the same commutative operator
+    """
+    operands = []
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node.type == 'binary' and node.operator == operator:
+            stack.append(node.right)
+            stack.append(node.left)
+        else:
+            operands.append(node)
+    return operands
+
+
+def date_range_of(node, transactions, now=None):
+    if node.type != 'binary':
+        return None
+    return node.date_range(transactions, now)
+
+
+def intersect(date_range, other):
+    if date_range is None:
+        return other
+    return max(date_range[0], other[0]), min(date_range[1], other[1])
+
+
+class Unary(Node):
     def __init__(self, token, right):
         self.type = 'unary'
         self.operator = token.value
@@ -78,20 +233,28 @@ class Unary:
         if self.operator == 'not':
             return not self.right(transaction)
 
+    def select(self, transactions, within, now=None):
+        if self.operator == 'not':
+            return within & ~self.right.select(transactions, within, now)
+        return 0
+
     def __str__(self):
         return '({} {})'.format(self.operator, self.right)
 
 
-class Atom:
+class Atom(Node):
     def __init__(self, token):
         self.type = token.type
         self.value = token.value.lower()
 
     def __call__(self, transaction):
         if self.type == 'tag':
-            return self.value in (
-                t.lower() for t in transaction.tags
-            )
+            return self.value in map(lower_string, transaction.tags)
+
+    def select(self, transactions, within, now=None):
+        if self.type != 'tag':
+            return 0
+        return transactions.tag_index.bitmap(self.value) & within
 
     def __str__(self):
         return self.value
@@ -21,16 +21,19 @@ class QueryParser:
     def run(self, text):
         self.text = text
         self.tokens = QueryLexer().run(text)
+        self.position = 0
         return self.maybe_binary(self.parse_atom(), 0)
 
     def pick(self):
-        return self.tokens[0]
+        return self.tokens[self.position]
 
     def pop(self):
-        return self.tokens.pop(0)
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
 
     def is_eof(self):
-        return not self.tokens
+        return self.position >= len(self.tokens)
 
     def is_operator(self):
         if self.is_eof():
@@ -60,18 +63,21 @@ class QueryParser:
         return token.type == 'punctuation' and token.value == ')'
 
     def maybe_binary(self, left, precedence):
-        token = self.is_operator()
-        if (token):
+        # loop instead of recursion for operators of the same precedence,
+        # so long chains of and/or don't exceed recursion limit
+        while True:
+            token = self.is_operator()
+            if not token:
+                return left
             try:
                 token_precedence = QueryParser.PRECEDENCE[token.value]
             except KeyError:
                 raise_parse(self.text, "invalid operator '{}'".format(token.value))
-            if token_precedence > precedence:
-                self.pop()
-                right = self.maybe_binary(self.parse_atom(), token_precedence)
-                binary = Binary(token, left, right)
-                return self.maybe_binary(binary, precedence)
-        return left
+            if token_precedence <= precedence:
+                return left
+            self.pop()
+            right = self.maybe_binary(self.parse_atom(), token_precedence)
+            left = Binary(token, left, right)
 
     def parse_atom(self):
         if self.is_eof():
@@ -106,7 +112,8 @@ def raise_parse(text, message):
 
 class QueryLexer:
     def run(self, text):
-        self.chars = list(text)
+        self.text = text
+        self.position = 0
         self.tokens = []
         while not self.is_eof():
             c = self.pick()
@@ -124,13 +131,15 @@ class QueryLexer:
         return list(self.clean_up(self.tokens))
 
     def pick(self):
-        return self.chars[0]
+        return self.text[self.position]
 
     def pop(self):
-        return self.chars.pop(0)
+        c = self.text[self.position]
+        self.position += 1
+        return c
 
     def is_eof(self):
-        return not self.chars
+        return self.position >= len(self.text)
 
     def push(self, token):
         self.tokens.append(token)
@@ -204,16 +213,13 @@ class QueryLexer:
         return QueryToken('string', word)
 
     def read_while(self, f):
-        word = ''
-        if self.is_eof():
-            return word
-        c = self.pick()
-        while not f(c):
-            word += self.pop()
-            if self.is_eof():
-                return word
-            c = self.pick()
-        return word
+        """
+        reads characters until f is true for one of them
+        """
+        start = self.position
+        while not self.is_eof() and not f(self.text[self.position]):
+            self.position += 1
+        return self.text[start:self.position]
 
     def clean_up(self, tokens):
         previous = None
@@ -62,7 +62,7 @@ def plot_months(
     line_color='black', average_line_color='blue',
     plus_marker_color=None, minus_marker_color=None
 ):
-    groups = transactions.group('year-month').sum()
+    groups = transactions.aggregate('year-month')
     months = list(_months_range(transactions))
     sums = [groups.get(m).amount(in_currency) for m in months]
     avgs = list(_calculate_moving_yearly_averages(sums))
@@ -131,7 +131,8 @@ def plot_days(
         return
     xticks = list(_index_dates([t.date for t in transactions]))
     xlabels = [t.date.strftime('%F') for t in transactions]
-    values = [transactions.group('date').sum()[k].amount(in_currency) for k in xlabels]
+    days = transactions.aggregate('date')
+    values = [days[k].amount(in_currency) for k in xlabels]
 
     fig, ax = plt.subplots(figsize=(20, 4))
     ax.set_xticks(xticks)
@@ -192,5 +193,5 @@ def least_squares(xs, ys):
         return None, None, None
 
 def monthly_average(transactions):
-    months = transactions.group('year-month')
-    return months.sum().sum() / len(list(_months_range(transactions)))
+    months = transactions.aggregate('year-month')
+    return months.sum() / len(list(_months_range(transactions)))
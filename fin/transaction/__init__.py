@@ -1,3 +1,6 @@
 from .transactions import Transactions
+from .transactions_columns import TransactionsColumns
 from .transaction import Transaction
-from .grouped_transactions import GroupedTransactions
\ No newline at end of file
+from .grouped_transactions import GroupedTransactions
+from .transactions_parser import iter_transactions
+from .transactions_loader import TransactionsLoader
\ No newline at end of file
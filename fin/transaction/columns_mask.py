@@ -0,0 +1,186 @@
+from datetime import datetime
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ..intern import lower_string
+from ..money import Money
+from ..query.query import flatten
+
+
+def query_mask(query, columns):
+    """
+    Returns numpy array of booleans, true for rows of columns
+    matching query. Query is evaluated node by node on whole columns,
+    nodes that can't be are evaluated per row, only for rows
+    that can still match.
+    query: Query
+    columns: TransactionsColumns
+    """
+    within = numpy.ones(len(columns), dtype=bool)
+    return ColumnsMask(columns, query.now).mask(query.tree, within)
+
+
+class Vectors:
+    """
+    numpy copies of columns of TransactionsColumns, with row
+    of each tag and first money item of each row
+    """
+    def __init__(self, columns):
+        size = len(columns)
+        rows = numpy.arange(size)
+        self.ordinals = numpy.array(columns._ordinals, dtype=numpy.int64)
+        self.tags = numpy.array(columns._tags, dtype=numpy.int64)
+        self.params = numpy.array(columns._params, dtype=object)
+        self.tag_rows = numpy.repeat(rows, numpy.diff(columns._tags_offsets))
+        money_offsets = numpy.array(columns._money_offsets, dtype=numpy.int64)
+        self.money_counts = numpy.diff(money_offsets)
+        has_money = self.money_counts > 0
+        first = money_offsets[:-1][has_money]
+        self.first_currency = numpy.full(size, -1, dtype=numpy.int64)
+        self.first_currency[has_money] = numpy.array(columns._currencies, dtype=numpy.int64)[first]
+        self.first_amount = numpy.zeros(size, dtype=numpy.int64)
+        self.first_amount[has_money] = numpy.array(columns._amounts, dtype=numpy.int64)[first]
+        self.tag_masks = {}
+
+
+def vectors(columns):
+    if columns._vectors is None:
+        columns._vectors = Vectors(columns)
+    return columns._vectors
+
+
+class ColumnsMask:
+    def __init__(self, columns, now=None):
+        self.columns = columns
+        self.now = now or datetime.now()
+        self.vectors = vectors(columns)
+
+    def mask(self, node, within):
+        """
+        returns mask of rows from within matching node
+        """
+        if node.type == 'binary' and node.operator == 'and':
+            for operand in flatten(node, 'and'):
+                within = self.mask(operand, within)
+            return within
+        elif node.type == 'binary' and node.operator == 'or':
+            selected = self.none()
+            for operand in flatten(node, 'or'):
+                selected |= self.mask(operand, within & ~selected)
+            return selected
+        elif node.type == 'binary':
+            relation = self.relation(node, within)
+            if relation is None:
+                return self.per_row(node, within)
+            return within & relation
+        elif node.type == 'unary':
+            if node.operator == 'not':
+                return within & ~self.mask(node.right, within)
+            return self.none()
+        elif node.type == 'tag':
+            return within & self.tag(node.value)
+        return self.none()
+
+    def none(self):
+        return numpy.zeros(len(self.columns), dtype=bool)
+
+    def per_row(self, node, within):
+        predicate = node.compile(self.now)
+        selected = self.none()
+        for row in numpy.flatnonzero(within).tolist():
+            selected[row] = bool(predicate(self.columns[row]))
+        return selected
+
+    def tag(self, tag):
+        masks = self.vectors.tag_masks
+        if tag not in masks:
+            ids = [
+                id for id, string in enumerate(self.columns._strings.strings)
+                if lower_string(string) == tag
+            ]
+            mask = self.none()
+            mask[self.vectors.tag_rows[numpy.isin(self.vectors.tags, ids)]] = True
+            masks[tag] = mask
+        return masks[tag]
+
+    def relation(self, node, within):
+        """
+        returns mask of rows in relation, or None if it
+        has to be evaluated per row
+        """
+        if not hasattr(node.right, 'value'):
+            return None
+        left_type = node.left.type
+        left_value = getattr(node.left, 'value', None)
+        value = node.right.value
+        if left_type == 'keyword' and left_value == 'date':
+            return self.date_relation(node.operator, node.date(self.now))
+        elif left_type == 'keyword' and left_value == 'money':
+            return self.money_relation(node.operator, Money(value))
+        elif left_type == 'keyword' and left_value == 'currency':
+            return self.currency_relation(node, value, within)
+        elif left_type == 'tag':
+            return self.tag_relation(node.operator, left_value, value)
+        return None
+
+    def date_relation(self, operator, date):
+        # rows have dates without time, so one later than midnight
+        # is between ordinals
+        ordinal = date.toordinal()
+        later = int(date != datetime.combine(date.date(), datetime.min.time(), date.tzinfo))
+        ordinals = self.vectors.ordinals
+        if operator == '<':
+            return ordinals < ordinal + later
+        elif operator == '<=':
+            return ordinals <= ordinal
+        elif operator == '>':
+            return ordinals > ordinal
+        elif operator == '>=':
+            return ordinals >= ordinal + later
+        elif operator == '=':
+            return (ordinals == ordinal) if not later else self.none()
+        elif operator == '!=':
+            return ~self.date_relation('=', date)
+        return None
+
+    def money_relation(self, operator, money):
+        # only equality of single currency, ordering needs
+        # converting each row to reference currency
+        if operator not in ('=', '!=') or len(money.currencies()) != 1:
+            return None
+        (currency, amount), = money._items()
+        equal = self.single_currency(currency) & (self.vectors.first_amount == amount)
+        return equal if operator == '=' else ~equal
+
+    def currency_relation(self, node, value, within):
+        # currencies of rows with other number of them than one
+        # are joined per row
+        if node.operator not in ('=', '!='):
+            return None
+        equal = self.single_currency(value)
+        single = self.vectors.money_counts == 1
+        related = equal if node.operator == '=' else single & ~equal
+        return related | self.per_row(node, within & ~single)
+
+    def single_currency(self, currency):
+        vectors = self.vectors
+        id = self.columns._strings.ids.get(currency, -2)
+        return (vectors.money_counts == 1) & (vectors.first_currency == id)
+
+    def tag_relation(self, operator, tag, value):
+        # tag without param is compared as ''
+        if operator not in ('=', '!='):
+            return None
+        vectors = self.vectors
+        entries = vectors.tags == self.columns._strings.ids.get(tag, -2)
+        rows = vectors.tag_rows[entries]
+        has_tag = self.none()
+        has_tag[rows] = True
+        equal = self.none()
+        equal[rows] = vectors.params[entries] == value
+        if value == '':
+            equal |= ~has_tag
+        return equal if operator == '=' else ~equal
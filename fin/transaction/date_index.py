@@ -0,0 +1,64 @@
+from array import array
+from bisect import bisect_left
+from bisect import bisect_right
+
+from ..bitmaps import from_rows
+from ..bitmaps import full
+
+
+class DateIndex:
+    """
+    Dates of transactions in ascending order with rows they come from,
+    so transactions from range of dates are found by binary search
+    """
+    def __init__(self, transactions):
+        self._size = len(transactions)
+        self.rows = array('l', sorted(
+            range(len(transactions)), key=lambda row: transactions[row].date
+        ))
+        self.dates = [transactions[row].date for row in self.rows]
+
+    def range(self, operator, date):
+        """
+        returns (start, end) of dates in relation given by operator
+        to date, or None if relation is not a range
+        """
+        if operator == '<':
+            return 0, bisect_left(self.dates, date)
+        elif operator == '<=':
+            return 0, bisect_right(self.dates, date)
+        elif operator == '=':
+            return bisect_left(self.dates, date), bisect_right(self.dates, date)
+        elif operator == '>=':
+            return bisect_left(self.dates, date), len(self.dates)
+        elif operator == '>':
+            return bisect_right(self.dates, date), len(self.dates)
+        return None
+
+    def count(self, operator, date):
+        """
+        number of dates in relation given by operator to date,
+        or None if operator isn't a comparison
+        """
+        if operator == '!=':
+            return len(self.dates) - self.count('=', date)
+        date_range = self.range(operator, date)
+        if date_range is None:
+            return None
+        start, end = date_range
+        return max(end - start, 0)
+
+    def bitmap(self, operator, date):
+        """
+        returns bitmap of rows with dates in relation given by operator
+        to date, or None if operator isn't a comparison
+        """
+        if operator == '!=':
+            return full(self._size) & ~self.bitmap('=', date)
+        date_range = self.range(operator, date)
+        if date_range is None:
+            return None
+        return self.range_bitmap(*date_range)
+
+    def range_bitmap(self, start, end):
+        return from_rows(self.rows[start:end], self._size)
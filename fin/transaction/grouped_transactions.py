@@ -1,4 +1,5 @@
 from ..money import GroupedMoney
+from ..money.money_aggregation import sum_grouped_money
 from ..grouped import Grouped, GroupedMonoid
 
 
@@ -35,9 +36,13 @@ class GroupedTransactions(Grouped, GroupedMonoid):
         })
 
     def sum(self):
-        return GroupedMoney({
-            k: v.sum() for k, v in self._groups.items()
-        })
+        if any(isinstance(v, GroupedTransactions) for v in self._groups.values()):
+            return GroupedMoney({
+                k: v.sum() for k, v in self._groups.items()
+            })
+        return GroupedMoney(sum_grouped_money(
+            (k, (t.money for t in v)) for k, v in self._groups.items()
+        ))
 
     def group(self, key):
         return GroupedTransactions({
@@ -46,3 +51,31 @@ class GroupedTransactions(Grouped, GroupedMonoid):
 
     def transactions(self):
         return self.values()
+
+
+def group_nested(items, keys):
+    """
+    items: iterable of (transaction, value)
+    keys: functions of transaction
+    returns nested dicts, one level for every key, of lists of values
+    """
+    if not keys:
+        raise ValueError('at least one key is needed to group by')
+    *outer_keys, inner_key = keys
+    groups = {}
+    for transaction, value in items:
+        level = groups
+        for key in outer_keys:
+            level = level.setdefault(key(transaction), {})
+        level.setdefault(inner_key(transaction), []).append(value)
+    return groups
+
+
+def wrap_nested(groups, depth, wrap):
+    if depth == 1:
+        return GroupedTransactions({
+            k: wrap(values) for k, values in groups.items()
+        })
+    return GroupedTransactions({
+        k: wrap_nested(subgroups, depth - 1, wrap) for k, subgroups in groups.items()
+    })
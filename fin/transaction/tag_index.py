@@ -0,0 +1,43 @@
+from collections import defaultdict
+
+from ..bitmaps import from_rows
+from ..intern import lower_string
+
+
+class TagIndex:
+    """
+    Inverted index from lowercase tag to rows of transactions with it.
+    Sets of rows are bitmaps: ints with nth bit set when nth transaction
+    is in the set, so and, or and not of queries are single operations
+    on ints instead of evaluating query for every transaction.
+    """
+    def __init__(self, transactions):
+        self._transactions = transactions
+        self._rows = defaultdict(list)
+        for row, transaction in enumerate(transactions):
+            for tag in transaction.tags:
+                self._rows[lower_string(tag)].append(row)
+        self._bitmaps = {}
+
+    def __len__(self):
+        return len(self._transactions)
+
+    def tags(self):
+        return self._rows.keys()
+
+    def count(self, tag):
+        """
+        number of transactions with tag
+        """
+        return len(self._rows.get(tag, ()))
+
+    def bitmap(self, tag):
+        """
+        tag: lowercase tag
+        returns bitmap of rows with tag
+        """
+        try:
+            return self._bitmaps[tag]
+        except KeyError:
+            self._bitmaps[tag] = from_rows(self._rows.get(tag, ()), len(self))
+            return self._bitmaps[tag]
@@ -0,0 +1,73 @@
+from collections.abc import ItemsView
+from collections.abc import Mapping
+
+
+class Tags(Mapping):
+    """
+    Immutable, ordered mapping of tag to its parameter (or None),
+    kept as two tuples instead of dict, names is tuple of tags
+    """
+    __slots__ = ('names', '_params')
+
+    _nones = {}
+
+    def __init__(self, tags=None):
+        if isinstance(tags, Tags):
+            self.names, self._params = tags.names, tags._params
+            return
+        tags = dict(tags or ())
+        self.names = tuple(tags)
+        self._params = self._params_tuple(tags.values())
+
+    @classmethod
+    def from_names(cls, names):
+        """
+        Tags without parameters
+        """
+        tags = cls.__new__(cls)
+        tags.names = tuple(dict.fromkeys(names))
+        tags._params = cls._params_tuple((None,) * len(tags.names))
+        return tags
+
+    @classmethod
+    def _params_tuple(cls, params):
+        # most of tags have no parameters,
+        # such tags of the same length share one tuple of Nones
+        params = tuple(params)
+        if any(p is not None for p in params):
+            return params
+        return cls._nones.setdefault(len(params), params)
+
+    def __getitem__(self, tag):
+        try:
+            return self._params[self.names.index(tag)]
+        except ValueError:
+            raise KeyError(tag)
+
+    def get(self, tag, default=None):
+        try:
+            return self._params[self.names.index(tag)]
+        except ValueError:
+            return default
+
+    def __contains__(self, tag):
+        return tag in self.names
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def items(self):
+        return _TagsItems(self)
+
+
+class _TagsItems(ItemsView):
+    __slots__ = ()
+
+    def __iter__(self):
+        return zip(self._mapping.names, self._mapping._params)
@@ -5,14 +5,17 @@ from datetime import datetime
 
 from .transaction_parser import parse_transaction
 from .transaction_parser import DATE_FORMAT
+from .tags import Tags
 
 
 class Transaction:
+    __slots__ = ('date', 'tags', 'money')
+
     def __init__(self, date, tags=None, money=None):
         if isinstance(date, str):
             date, tags, money = parse_transaction(date)
         self.date = date
-        self.tags = tags
+        self.tags = tags if isinstance(tags, Tags) else Tags(tags)
         self.money = money
 
     def __eq__(self, other):
@@ -1,5 +1,8 @@
 from collections import OrderedDict
+import re
 
+from .tags import Tags
+from ..intern import intern_string
 from ..money import Money
 from ..exceptions import TransactionParseError
 from ..exceptions import MoneyParseError
@@ -10,8 +13,45 @@ import datetime
 DATE_FORMAT = '%Y-%m-%d'
 DATE_FORMAT_LENGTH = len('2016-01-01')
 
+# date -> space separated tags without parameters ->
+# amount in single currency, optionally separated from currency by one space
+SIMPLE_TRANSACTION = re.compile(
+    r'^(\d{4})-(\d{2})-(\d{2})'
+    r'((?: +[^\s()]+)*?)'
+    r' +(-?)(\d+)(?:[\.,](\d{1,2}))? ?([^\d\s+]+)$'
+)
+
 
 def parse_transaction(text):
+    return parse_simple_transaction(text) or parse_any_transaction(text)
+
+
+def parse_simple_transaction(text):
+    """
+    Fast path for the most common shape of transaction, returns None
+    when text should be handled by parse_any_transaction
+    """
+    match = SIMPLE_TRANSACTION.match(text)
+    if not match:
+        return None
+    year, month, day, tags, sign, base_unit, subunit, currency = match.groups()
+    try:
+        date = datetime.datetime(int(year), int(month), int(day))
+    except ValueError:
+        return None
+    amount = int(base_unit) * 100
+    if sign:
+        amount = -amount
+    if subunit:
+        amount += int(subunit) * 10 if len(subunit) == 1 else int(subunit)
+    return (
+        date,
+        Tags.from_names(map(intern_string, tags.split())),
+        Money.single(intern_string(currency), amount)
+    )
+
+
+def parse_any_transaction(text):
     def parse_date_from_prefix(date_and_rest):
         try:
             date_string = date_and_rest[:DATE_FORMAT_LENGTH]
@@ -39,7 +79,7 @@ def parse_transaction(text):
         )
 
     def parse_tags(text):
-        return TagsParser().run(text)
+        return Tags(TagsParser().run(text))
 
     if text.startswith('#'):
         return None, None, None
@@ -52,7 +92,10 @@ def parse_transaction(text):
 class TagsLexer:
     def run(self, text):
         self._text = text
-        self._tokens = ['']
+        # finished tokens and characters of the token being read,
+        # joined once it's finished
+        self._tokens = []
+        self._token = ['']
         self._parenthesis_counter = 0
 
         for c in self._text:
@@ -64,10 +107,15 @@ class TagsLexer:
                 self._tokenize_right_parenthesis(c)
             else:
                 self._tokenize_character(c)
+        self._finish_token()
         return [t for t in self._tokens if t]
 
     def add_token(self, token):
-        self._tokens.append(token)
+        self._finish_token()
+        self._token = [token]
+
+    def _finish_token(self):
+        self._tokens.append(''.join(self._token))
 
     def is_top_level(self):
         return self._parenthesis_counter == 0
@@ -95,35 +143,37 @@ class TagsLexer:
             self._tokenize_character(c)
 
     def _tokenize_character(self, c):
-        self._tokens[-1] += c
+        self._token.append(c)
 
 
 class TagsParser:
     def run(self, text):
         self.tokens = TagsLexer().run(text)
+        self.position = 0
         self.tags = OrderedDict()
         self.parse_tags()
         return self.tags
 
     def pick(self):
-        return self.tokens[0]
+        return self.tokens[self.position]
 
     def pop(self):
-        return self.tokens.pop(0)
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
 
     def is_eof(self):
-        return not self.tokens
+        return self.position >= len(self.tokens)
 
     def is_word(self):
         return self.pick() != '(' and self.pick() != ')'
 
     def parse_tags(self):
-        if not self.is_eof():
+        while not self.is_eof():
             self.parse_tag()
-            self.parse_tags()
 
     def parse_tag(self):
-        tag = self.pop_word()
+        tag = intern_string(self.pop_word())
         parameter = None
         if not self.is_eof() and self.pick() == '(':
             parameter = self.pop_parameter()
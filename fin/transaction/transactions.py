@@ -1,22 +1,73 @@
 from datetime import datetime
-from collections import defaultdict
 from collections import Counter
 from collections import OrderedDict
 
 from .transactions_parser import parse_transactions
+from .transactions_parser import iter_transactions
+from .transactions_cache import load_cached_transactions
 from .transaction import Transaction
-from .grouped_transactions import GroupedTransactions
-from ..money import Money
+from .tag_index import TagIndex
+from .date_index import DateIndex
+from .grouped_transactions import group_nested
+from .grouped_transactions import wrap_nested
+from ..money import MoneyAccumulator
+from ..money import GroupedMoney
+from ..money.currency import prefetch_transactions
+from ..money.money_aggregation import sum_money
+from ..money.money_aggregation import aggregate_grouped_money
+from ..bitmaps import full
+from ..bitmaps import iter_rows
+from ..grouped import Grouped
 from ..query import by
+from ..query import Query
 from ..query import query
 
 
 class Transactions:
-    def __init__(self, transactions=None):
+    def __init__(self, transactions=None, workers=None):
         if isinstance(transactions, str):
-            self._transactions = parse_transactions(transactions)
+            self._transactions = parse_transactions(transactions, workers)
+        elif isinstance(transactions, list):
+            self._transactions = transactions
         else:
-            self._transactions = transactions or []
+            self._transactions = list(transactions or [])
+        self._tag_index = None
+        self._date_index = None
+
+    @classmethod
+    def from_file(cls, path, encoding='utf-8', workers=None, cache=False):
+        if cache:
+            return cls(load_cached_transactions(path, encoding, workers))
+        with open(path, 'r', encoding=encoding) as f:
+            return cls(iter_transactions(f, workers))
+
+    @property
+    def tag_index(self):
+        """
+        TagIndex of transactions, built on first use
+        """
+        if self._tag_index is None:
+            self._tag_index = TagIndex(self._transactions)
+        return self._tag_index
+
+    @property
+    def date_index(self):
+        """
+        DateIndex of transactions, built on first use
+        """
+        if self._date_index is None:
+            self._date_index = DateIndex(self._transactions)
+        return self._date_index
+
+    def _replace_from(self, start, transactions):
+        """
+        replaces transactions from start to the end in place,
+        indexes are built again when they're needed
+        """
+        del self._transactions[start:]
+        self._transactions.extend(transactions)
+        self._tag_index = None
+        self._date_index = None
 
     def __len__(self):
         return len(self._transactions)
@@ -43,6 +94,7 @@ class Transactions:
         return self + other.map(lambda t: -t)
 
     def convert(self, currency):
+        prefetch_transactions(self, currency)
         return Transactions([t.convert(currency) for t in self])
 
     def append(self, transaction):
@@ -54,26 +106,52 @@ class Transactions:
     def filter(self, f):
         if isinstance(f, str):
             f = query(f)
+        elif hasattr(f, 'select') and not isinstance(f, Query):
+            f = Query(f)
+        if isinstance(f, Query):
+            transactions = self._transactions
+            return Transactions([
+                transactions[row] for row in iter_rows(f.select(self, full(len(self))))
+            ])
         return Transactions([t for t in self if f(t)])
 
     def sum(self):
-        return sum((t.money for t in self), Money())
+        return sum_money(t.money for t in self)
 
     def group(self, key):
+        return self.group_by(key)
+
+    def aggregate(self, key, reducer='sum'):
+        """
+        Same as group(key) followed by reducing each group, but computed
+        in single pass without creating groups of transactions.
+        reducer: 'sum', 'min', 'max' or 'mean' of amounts in each currency
+            returned as GroupedMoney, or 'count' of transactions in each group
+            returned as Grouped numbers
+        """
         if isinstance(key, str):
             key = by(key)
-        groups = defaultdict(Transactions)
-        for transaction in self:
-            transaction_key = key(transaction)
-            groups[transaction_key] = groups[transaction_key].append(transaction)
-        return GroupedTransactions(dict(groups))
+        if reducer == 'count':
+            return Grouped(dict(Counter(key(t) for t in self)))
+        return GroupedMoney(aggregate_grouped_money(
+            ((key(t), t.money) for t in self), reducer
+        ))
+
+    def group_by(self, *keys):
+        """
+        Groups by every key in single pass,
+        for more than one key groups are nested in order of keys
+        """
+        keys = [by(key) if isinstance(key, str) else key for key in keys]
+        groups = group_nested(((t, t) for t in self), keys)
+        return wrap_nested(groups, len(keys), Transactions)
 
     def merge(self, key=None):
         if key == None:
             merged_currency = None
             merged_date = datetime(1970, 1, 1)
             merged_tags = OrderedDict()
-            merged_money = Money()
+            merged_money = MoneyAccumulator()
             for transaction in self:
                 merged_date = max(merged_date, transaction.date)
                 for tag, param in transaction.tags.items():
@@ -84,7 +162,7 @@ class Transactions:
                     else:
                         merged_tags[tag] = merged_tags[tag] or param
                 merged_money += transaction.money
-            return Transactions([Transaction(merged_date, merged_tags, merged_money)])
+            return Transactions([Transaction(merged_date, merged_tags, merged_money.freeze())])
         merged = []
         for transactions in self.group(key).values():
             merged += transactions.merge()
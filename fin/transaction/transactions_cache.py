@@ -0,0 +1,172 @@
+from datetime import datetime
+import gc
+import hashlib
+import json
+import os
+
+from .transaction import Transaction
+from .tags import Tags
+from .transactions_parser import iter_transactions
+from ..intern import intern_string
+from ..money import Money
+
+
+SNAPSHOT_SUFFIX = '.fincache'
+SNAPSHOT_VERSION = 2
+
+
+def load_cached_transactions(path, encoding='utf-8', workers=None):
+    """
+    Loads transactions from snapshot stored next to the file at path,
+    file is parsed (and snapshot rewritten) only if it changed since
+    the snapshot was taken. When modification time and size are the same
+    the snapshot is trusted, otherwise content hash is compared.
+    """
+    path = os.path.abspath(path)
+    key = snapshot_key(path)
+    snapshot = read_snapshot(snapshot_path(path))
+    if snapshot is not None:
+        if snapshot['key'] != key and snapshot['digest'] == file_digest(path):
+            # only modification time changed, hash isn't needed next time
+            snapshot['key'] = key
+            write_snapshot(snapshot_path(path), snapshot)
+        if snapshot['key'] == key:
+            transactions = decode_transactions(snapshot)
+            if transactions is not None:
+                return transactions
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        transactions = list(iter_transactions(
+            decode_lines(f, digest, encoding), workers
+        ))
+    write_snapshot(snapshot_path(path), encode_transactions(
+        transactions, key, digest.hexdigest()
+    ))
+    return transactions
+
+
+def snapshot_path(path):
+    return path + SNAPSHOT_SUFFIX
+
+
+def snapshot_key(path):
+    stat = os.stat(path)
+    return [path, stat.st_mtime_ns, stat.st_size]
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def decode_lines(f, digest, encoding):
+    for line in f:
+        digest.update(line)
+        yield line.decode(encoding)
+
+
+def read_snapshot(path):
+    """
+    snapshot is plain JSON, so reading it can't run any code
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+
+def write_snapshot(path, snapshot):
+    temporary_path = path + '.tmp'
+    try:
+        with open(temporary_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temporary_path, path)
+    except OSError:
+        pass
+
+
+def encode_transactions(transactions, key, digest):
+    """
+    dates are stored as ordinals, tags and currencies as indexes
+    of interned strings and money as integer hundredth parts
+    """
+    strings = {}
+
+    def intern(text):
+        try:
+            return strings[text]
+        except KeyError:
+            strings[text] = len(strings)
+            return strings[text]
+
+    # identical tags of different transactions are stored once,
+    # rows refer to them by index
+    tags_indexes = {}
+    ordinals = []
+    tags = []
+    money = []
+    for transaction in transactions:
+        ordinals.append(transaction.date.toordinal())
+        tags_tuple = tuple(
+            (intern(tag), param) for tag, param in transaction.tags.items()
+        )
+        tags.append(tags_indexes.setdefault(tags_tuple, len(tags_indexes)))
+        money.append([
+            item
+            for currency, amount in transaction.money._items()
+            for item in (intern(currency), amount)
+        ])
+    return {
+        'version': SNAPSHOT_VERSION,
+        'key': key,
+        'digest': digest,
+        'strings': list(strings),
+        'tags_sets': [[list(tag) for tag in tags_tuple] for tags_tuple in tags_indexes],
+        'ordinals': ordinals,
+        'tags': tags,
+        'money': money,
+    }
+
+
+def decode_transactions(snapshot):
+    """
+    returns transactions from snapshot, None if it's malformed
+    """
+    try:
+        strings = [intern_string(text) for text in snapshot['strings']]
+        # shared tags are decoded once, they are immutable
+        # so transactions share them too
+        tags_sets = [
+            Tags((strings[tag], param) for tag, param in tags)
+            for tags in snapshot['tags_sets']
+        ]
+        # rows don't form reference cycles, so collecting garbage
+        # while creating them is only wasted time
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return [
+                Transaction(
+                    datetime.fromordinal(ordinal),
+                    tags_sets[tags],
+                    Money({
+                        strings[money[i]]: money[i + 1]
+                        for i in range(0, len(money), 2)
+                    })
+                )
+                for ordinal, tags, money in zip(
+                    snapshot['ordinals'], snapshot['tags'], snapshot['money']
+                )
+            ]
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+    except (KeyError, IndexError, TypeError, ValueError, OverflowError):
+        return None
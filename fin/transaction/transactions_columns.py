@@ -0,0 +1,165 @@
+from array import array
+from collections import Counter
+from datetime import datetime
+
+from .transaction import Transaction
+from .tags import Tags
+from .transactions import Transactions
+from .grouped_transactions import group_nested
+from .grouped_transactions import wrap_nested
+from .columns_mask import numpy
+from .columns_mask import query_mask
+from ..intern import InternTable
+from ..money import Money
+from ..money.currency import prefetch_transactions
+from ..money.money_aggregation import sum_by_key
+from ..query import by
+from ..query import Query
+from ..query import query
+
+
+class TransactionsColumns:
+    """
+    Column oriented alternative to Transactions with the same interface.
+
+    Dates are kept as ordinals (so with precision of a day), tags
+    and currencies as ids in table of strings shared by collections
+    derived from each other, amounts as 64 bit integers. Tags and money
+    of nth transaction are in range [offsets[n], offsets[n + 1])
+    of their columns.
+
+    When numpy is installed queries are evaluated as masks
+    over whole columns.
+    """
+    def __init__(self, transactions=None, strings=None):
+        if isinstance(transactions, str):
+            transactions = Transactions(transactions)
+        self._strings = strings if strings is not None else InternTable()
+        self._ordinals = array('i')
+        self._tags_offsets = array('l', [0])
+        self._tags = array('i')
+        self._params = []
+        self._money_offsets = array('l', [0])
+        self._currencies = array('i')
+        self._amounts = array('q')
+        self._vectors = None
+        for transaction in transactions or []:
+            self._append(transaction)
+
+    @classmethod
+    def from_transactions(cls, transactions):
+        return cls(transactions)
+
+    def to_transactions(self):
+        return Transactions(list(self))
+
+    def _append(self, transaction):
+        index = self._strings.index
+        self._ordinals.append(transaction.date.toordinal())
+        for tag, param in transaction.tags.items():
+            self._tags.append(index(tag))
+            self._params.append(param)
+        self._tags_offsets.append(len(self._tags))
+        for currency, amount in transaction.money._items():
+            self._currencies.append(index(currency))
+            self._amounts.append(amount)
+        self._money_offsets.append(len(self._amounts))
+
+    def _take(self, indexes):
+        taken = TransactionsColumns(strings=self._strings)
+        for index in indexes:
+            taken._ordinals.append(self._ordinals[index])
+            start, end = self._tags_offsets[index], self._tags_offsets[index + 1]
+            taken._tags.extend(self._tags[start:end])
+            taken._params.extend(self._params[start:end])
+            taken._tags_offsets.append(len(taken._tags))
+            start, end = self._money_offsets[index], self._money_offsets[index + 1]
+            taken._currencies.extend(self._currencies[start:end])
+            taken._amounts.extend(self._amounts[start:end])
+            taken._money_offsets.append(len(taken._amounts))
+        return taken
+
+    def _row(self, index):
+        strings = self._strings.strings
+        start, end = self._tags_offsets[index], self._tags_offsets[index + 1]
+        tags = Tags(
+            (strings[tag], param)
+            for tag, param in zip(self._tags[start:end], self._params[start:end])
+        )
+        start, end = self._money_offsets[index], self._money_offsets[index + 1]
+        money = Money({
+            strings[currency]: amount
+            for currency, amount in zip(self._currencies[start:end], self._amounts[start:end])
+        })
+        return Transaction(datetime.fromordinal(self._ordinals[index]), tags, money)
+
+    def __len__(self):
+        return len(self._ordinals)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('transaction index out of range')
+        return self._row(index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._row(index)
+
+    def __eq__(self, other):
+        if not isinstance(other, (Transactions, TransactionsColumns)):
+            return False
+        return Counter(str(t) for t in self) == Counter(str(t) for t in other)
+
+    def __str__(self):
+        return '\n'.join(str(t) for t in self)
+
+    def __add__(self, other):
+        added = self._take(range(len(self)))
+        for transaction in other:
+            added._append(transaction)
+        return added
+
+    def __sub__(self, other):
+        return self + other.map(lambda t: -t)
+
+    def convert(self, currency):
+        prefetch_transactions(self, currency)
+        return self.map(lambda t: t.convert(currency))
+
+    def append(self, transaction):
+        return self + [transaction]
+
+    def map(self, f):
+        return TransactionsColumns((f(t) for t in self), self._strings)
+
+    def filter(self, f):
+        if isinstance(f, str):
+            f = query(f)
+        elif hasattr(f, 'select') and not isinstance(f, Query):
+            f = Query(f)
+        if numpy is not None and isinstance(f, Query):
+            return self._take(numpy.flatnonzero(query_mask(f, self)).tolist())
+        return self._take([i for i, t in enumerate(self) if f(t)])
+
+    def sum(self):
+        amounts = sum_by_key(self._currencies, self._amounts)
+        strings = self._strings.strings
+        return Money({
+            strings[currency]: amount for currency, amount in amounts.items()
+        })
+
+    def group(self, key):
+        return self.group_by(key)
+
+    def group_by(self, *keys):
+        keys = [by(key) if isinstance(key, str) else key for key in keys]
+        groups = group_nested(((t, i) for i, t in enumerate(self)), keys)
+        return wrap_nested(groups, len(keys), self._take)
+
+    def merge(self, key=None):
+        return TransactionsColumns(
+            self.to_transactions().merge(key), self._strings
+        )
+
@@ -0,0 +1,92 @@
+import os
+
+from .transactions import Transactions
+from .transactions_parser import iter_transactions
+from ..exceptions import TransactionParseError
+
+
+class TransactionsLoader:
+    """
+    Keeps transactions of file that only grows at the end up to date,
+    each load parses only lines appended since the previous one.
+    When beginning of the file or the end of the already parsed part
+    changed, file is considered rewritten and is parsed from scratch.
+    Last line without newline is parsed too, if it can be, but it's
+    parsed again by the next load, as it may be still being written.
+    """
+    FINGERPRINT_SIZE = 4096
+
+    def __init__(self, path, encoding='utf-8', workers=None):
+        self.path = path
+        self.encoding = encoding
+        self.workers = workers
+        self.reset()
+
+    def reset(self):
+        self.transactions = Transactions()
+        self.offset = 0
+        self.line_count = 0
+        self._fingerprint = b''
+        self._tail_size = 0
+
+    def load(self):
+        with open(self.path, 'rb') as f:
+            if not self._is_continuation(f):
+                self.reset()
+            f.seek(self.offset)
+            lines = _CompleteLines(f, self.encoding)
+            appended = list(iter_transactions(
+                lines, self.workers, self.line_count
+            ))
+            self.offset += lines.size
+            self.line_count += lines.count
+            tail = self._parse_tail(lines.tail)
+            self.transactions._replace_from(
+                len(self.transactions) - self._tail_size, appended + tail
+            )
+            self._tail_size = len(tail)
+            self._fingerprint = self._read_fingerprint(f)
+        return self.transactions
+
+    def _parse_tail(self, tail):
+        try:
+            return list(iter_transactions([tail.decode(self.encoding)], None, self.line_count))
+        except (UnicodeDecodeError, TransactionParseError):
+            # line isn't written completely yet
+            return []
+
+    def _is_continuation(self, f):
+        if os.fstat(f.fileno()).st_size < self.offset:
+            return False
+        return self._read_fingerprint(f) == self._fingerprint
+
+    def _read_fingerprint(self, f):
+        head_size = min(self.offset, self.FINGERPRINT_SIZE)
+        tail_start = max(self.offset - self.FINGERPRINT_SIZE, head_size)
+        f.seek(0)
+        head = f.read(head_size)
+        f.seek(tail_start)
+        return head + f.read(self.offset - tail_start)
+
+
+class _CompleteLines:
+    """
+    Decoded lines of binary file, stops before the last line
+    if it's not terminated yet, because it may be still being written,
+    such line is kept undecoded in tail
+    """
+    def __init__(self, f, encoding):
+        self.f = f
+        self.encoding = encoding
+        self.size = 0
+        self.count = 0
+        self.tail = b''
+
+    def __iter__(self):
+        for line in self.f:
+            if not line.endswith(b'\n'):
+                self.tail = line
+                return
+            self.size += len(line)
+            self.count += 1
+            yield line.decode(self.encoding)
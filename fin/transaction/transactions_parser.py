@@ -1,21 +1,71 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
 from .transaction import Transaction
 from ..exceptions import TransactionParseError
 
 COMMENT = '#'
+CHUNK_SIZE = 10000
+
+
+def parse_transactions(text, workers=None):
+    return list(iter_transactions(text.splitlines(), workers))
+
+
+def iter_transactions(lines, workers=None, first_line_number=0):
+    """
+    lines: file object or any other iterable of lines,
+        transactions are parsed and yielded one line at a time
+    workers: number of processes parsing chunks of lines in parallel,
+        transactions are still yielded in the original order
+    first_line_number: number of lines preceding lines,
+        used in errors when lines are continuation of some text
+    """
+    if workers and workers > 1:
+        return iter_transactions_in_parallel(lines, workers, first_line_number=first_line_number)
+    return iter_transactions_from_line(lines, first_line_number)
+
+
+def iter_transactions_from_line(lines, first_line_number=0):
+    for line_number, line in enumerate(lines, first_line_number):
+        line = line.rstrip('\r\n')
+        if line.strip() and not line.startswith(COMMENT):
+            yield parse_transaction_at_line(line, line_number)
+
+
+def iter_transactions_in_parallel(lines, workers, chunk_size=CHUNK_SIZE, first_line_number=0):
+    # only a few chunks are in flight at once, so lines read from file
+    # are never all kept in memory
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in split_into_chunks(lines, chunk_size, first_line_number):
+            pending.append(executor.submit(parse_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def split_into_chunks(lines, chunk_size, first_line_number=0):
+    lines = iter(lines)
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            return
+        yield first_line_number, chunk
+        first_line_number += len(chunk)
+
+
+def parse_chunk(chunk):
+    first_line_number, lines = chunk
+    return list(iter_transactions_from_line(lines, first_line_number))
 
 
-def parse_transactions(text):
-    def parse_transaction(text, line_number):
-        try:
-            if text.startswith('#'):
-                return None
-            return Transaction(text)
-        except TransactionParseError as e:
-            raise TransactionParseError(
-                '{} at line: {}'.format(e, line_number + 1)
-            )
-
-    return [
-        parse_transaction(t, i) for i, t in enumerate(text.splitlines())
-        if t.strip() and not t.startswith(COMMENT)
-    ]
+def parse_transaction_at_line(text, line_number):
+    try:
+        return Transaction(text)
+    except TransactionParseError as e:
+        raise TransactionParseError(
+            '{} at line: {}'.format(e, line_number + 1)
+        )
@@ -1,7 +1,17 @@
 # -*- coding: utf-8 -*-
 import unittest
 import os
+import json
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from urllib.parse import urlparse
+from urllib.parse import parse_qs
 from fin import currency
+from fin.money.currency import HttpProvider
+from fin.money.rates_store import RatesStore
+from fin import Transactions
 from datetime import date
 
 
@@ -9,8 +19,13 @@ from datetime import date
 
 class ConvertTest(unittest.TestCase):
     def setUp(self):
+        self.cache_path = currency.cache_path
+        currency.setup_cache(None)
         currency.cache = {}
 
+    def tearDown(self):
+        currency.setup_cache(self.cache_path)
+
     def test_convert(self):
         self.assertEqual(2 * 4.2732, currency.convert(2, 'EUR', 'PLN', date(2015, 1, 1)))
 
@@ -27,7 +42,7 @@ class ConvertTest(unittest.TestCase):
         except Exception as e:
             print(e)
             self.assertEqual(
-                "Couldn't download conversion rates for base: 'test' at date: '2015-01-01', because: [422] Invalid base",
+                "No conversion rates of currency 'test' at date: '2015-01-01'",
                 str(e)
             )
             raised = True
@@ -39,7 +54,7 @@ class ConvertTest(unittest.TestCase):
             currency.convert(1, '€', 'test', date(2015, 1, 1))
         except Exception as e:
             self.assertEqual(
-                "Currency 'test' is not supported by fixer.io",
+                "No conversion rates of currency 'test' at date: '2015-01-01'",
                 str(e)
             )
             raised = True
@@ -54,13 +69,110 @@ class ConvertTest(unittest.TestCase):
         )
 
     def test_saves_cache_to_file(self):
-        currency.setup_cache('test_ratios.json')
-        currency.cache = 'test'
-        currency._save_cache()
-        with open('test_ratios.json', 'r', encoding='utf-8') as f:
-            self.assertEqual('"test"', f.read())
+        with tempfile.TemporaryDirectory() as directory:
+            currency.setup_cache(os.path.join(directory, 'test_ratios.json'))
+            currency._store_rates('2015-01-01', 'EUR', {'PLN': 4.2732})
+            store = RatesStore(os.path.join(directory, 'test_ratios.sqlite'))
+            self.assertEqual(store.get('2015-01-01', 'EUR'), {'PLN': 4.2732})
+            store.close()
+            currency.setup_cache(self.cache_path)
+
+RATES = {
+    'EUR': {'PLN': 4.0, 'USD': 1.25},
+    'PLN': {'EUR': 0.25, 'USD': 0.3125},
+    'USD': {'EUR': 0.8, 'PLN': 3.2},
+}
+
+
+class RatesHandler(BaseHTTPRequestHandler):
+    """
+    stand-in for fixer.io, serves RATES for any date
+    """
+    def do_GET(self):
+        url = urlparse(self.path)
+        base = parse_qs(url.query)['base'][0]
+        self.server.requested.append((url.path.strip('/'), base))
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.end_headers()
+        self.wfile.write(json.dumps({'base': base, 'rates': RATES[base]}).encode('utf-8'))
+
+    def log_message(self, *args):
+        pass
+
+
+class PrefetchTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), RatesHandler)
+        self.server.requested = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.provider = currency.setup_provider(
+            HttpProvider('http://127.0.0.1:{}'.format(self.server.server_port))
+        )
+        self.cache_path = currency.cache_path
         currency.setup_cache(None)
-        os.remove('test_ratios.json')
+        currency.cache = {}
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        currency.setup_provider(self.provider)
+        currency.setup_cache(self.cache_path)
+        currency.cache = {}
+
+    def test_prefetch(self):
+        currency.prefetch([
+            (date(2015, 1, 1), '€'),
+            (date(2015, 1, 1), 'zł'),
+            (date(2015, 1, 2), 'EUR'),
+            (date(2015, 1, 2), 'zł'),
+        ], 'PLN')
+        self.assertEqual(
+            sorted(self.server.requested),
+            [('2015-01-01', 'EUR'), ('2015-01-02', 'EUR')]
+        )
+        self.assertEqual(currency.convert(2, '€', 'zł', date(2015, 1, 2)), 8.0)
+        self.assertEqual(currency.convert(8, 'zł', '$', date(2015, 1, 2)), 2.5)
+        self.assertEqual(len(self.server.requested), 2)
+
+    def test_prefetch_skips_cached_rates(self):
+        currency.convert(1, 'EUR', 'PLN', date(2015, 1, 1))
+        currency.prefetch([(date(2015, 1, 1), 'PLN'), (date(2015, 1, 1), 'USD')])
+        self.assertEqual(self.server.requested, [('2015-01-01', 'EUR')])
+
+    def test_cross_rates(self):
+        self.assertEqual(currency.convert(1, 'USD', 'PLN', date(2015, 1, 1)), 3.2)
+        self.assertEqual(currency.convert(4, 'PLN', 'EUR', date(2015, 1, 1)), 1.0)
+        self.assertEqual(self.server.requested, [('2015-01-01', 'EUR')])
+        self.assertEqual(list(currency.cache['2015-01-01']), ['EUR'])
+
+    def test_cross_rate_of_unknown_currency(self):
+        with self.assertRaisesRegex(Exception, "No conversion rates of currency 'test' at date: '2015-01-01'"):
+            currency.convert(1, 'test', 'PLN', date(2015, 1, 1))
+
+    def test_uses_rates_cached_per_base(self):
+        currency.cache = {'2015-01-01': {'PLN': {'USD': 0.3}}}
+        self.assertEqual(currency.convert(10, 'PLN', 'USD', date(2015, 1, 1)), 3.0)
+        currency.prefetch([(date(2015, 1, 1), 'PLN')], 'USD')
+        self.assertEqual(self.server.requested, [])
+
+    def test_convert_transactions(self):
+        transactions = Transactions('''2015-01-01 a 4zł
+2015-01-01 b 5$
+2015-01-02 c 8zł
+2015-01-02 d 2€
+''')
+        self.assertEqual(
+            str(transactions.convert('€')),
+            '2015-01-01 a 1,00 €\n'
+            '2015-01-01 b 4,00 €\n'
+            '2015-01-02 c 2,00 €\n'
+            '2015-01-02 d 2,00 €'
+        )
+        self.assertEqual(
+            sorted(self.server.requested),
+            [('2015-01-01', 'EUR'), ('2015-01-02', 'EUR')]
+        )
 
 
 if __name__ == '__main__':
@@ -4,11 +4,21 @@ from datetime import datetime
 from collections import defaultdict
 
 from fin import Money
+from fin.money import MoneyAccumulator
 from fin import currency
 from fin import MoneyParseError
 
 
 currency.cache = {'2016-01-01': {'PLN': {'EUR': 0.25}, 'USD': {'EUR': 0.5}}}
+cache_path = currency.cache_path
+
+
+def setUpModule():
+    currency.setup_cache(None)
+
+
+def tearDownModule():
+    currency.setup_cache(cache_path)
 
 
 class MoneyParsingTest(unittest.TestCase):
@@ -124,9 +134,48 @@ class MoneyOperationsTest(unittest.TestCase):
     def test_amount(self):
         self.assertEqual(Money('19zł').amount('zł'), 19)
 
+    def test_single_currency_addition(self):
+        self.assertEqual(Money('10,50zł') + Money('-3zł'), Money('7,50zł'))
+        self.assertEqual(Money.single('zł', 750), Money('7,50zł'))
+
+    def test_removing_currency(self):
+        self.assertEqual(
+            str(Money('10zł + 5€') - Money('5€')),
+            '10,00 zł + 0,00 €'
+        )
+
     def test_neq(self):
         self.assertEqual(-Money('19zł').amount('zł'), Money('-19zł'))
 
+    def test_amounts_are_read_only(self):
+        money = Money('10zł + 5€')
+        self.assertEqual(money._amounts['zł'], 1000)
+        self.assertEqual(money._amounts['$'], 0)
+        with self.assertRaises(TypeError):
+            money._amounts['zł'] = 0
+        self.assertEqual(str(money), '10,00 zł + 5,00 €')
+
+
+class MoneyAccumulatorTest(unittest.TestCase):
+    def test_add_in_place(self):
+        accumulator = MoneyAccumulator()
+        same = accumulator
+        accumulator += Money('10zł')
+        accumulator += Money('1€')
+        accumulator -= Money('5zł')
+        self.assertIs(accumulator, same)
+        self.assertEqual(accumulator.freeze(), Money('5zł + 1€'))
+
+    def test_freeze_is_not_changed_by_further_adding(self):
+        accumulator = MoneyAccumulator(Money('10zł'))
+        frozen = accumulator.freeze()
+        accumulator += Money('10zł')
+        self.assertEqual(frozen, Money('10zł'))
+        self.assertEqual(accumulator.freeze(), Money('20zł'))
+
+    def test_empty(self):
+        self.assertEqual(MoneyAccumulator().freeze(), Money())
+
 
 class MoneyConversionTest(unittest.TestCase):
     def test_convert_money(self):
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+import unittest
+import random
+from array import array
+
+from fin import Money
+from fin.money import money_aggregation
+from fin.money.money_aggregation import sum_by_key
+from fin.money.money_aggregation import sum_money
+from fin.money.money_aggregation import sum_grouped_money
+
+
+class MoneyAggregationTest(unittest.TestCase):
+    def test_sum_money(self):
+        self.assertEqual(
+            sum_money([Money('10zł'), Money('1€ + 5zł'), Money('-1€')]),
+            Money('15zł + 0€')
+        )
+
+    def test_sum_no_money(self):
+        self.assertEqual(sum_money([]), Money())
+
+    def test_sum_grouped_money(self):
+        self.assertEqual(
+            sum_grouped_money([
+                ('a', [Money('10zł'), Money('1€')]),
+                ('b', [Money('2€'), Money('3€')]),
+                ('c', []),
+            ]),
+            {'a': Money('10zł + 1€'), 'b': Money('5€'), 'c': Money()}
+        )
+
+
+@unittest.skipIf(money_aggregation.numpy is None, 'numpy is not installed')
+class NumpyMoneyAggregationTest(unittest.TestCase):
+    def setUp(self):
+        r = random.Random(0)
+        self.keys = [r.choice(('zł', '€', '$')) for _ in range(5000)]
+        self.amounts = [r.randint(-10 ** 12, 10 ** 12) for _ in range(5000)]
+
+    def expected(self, keys):
+        totals = {}
+        for key, amount in zip(keys, self.amounts):
+            totals[key] = totals.get(key, 0) + amount
+        return totals
+
+    def test_sum_by_key(self):
+        self.assertEqual(sum_by_key(self.keys, self.amounts), self.expected(self.keys))
+
+    def test_sum_by_integer_key(self):
+        keys = array('i', (len(k) for k in self.keys))
+        self.assertEqual(
+            sum_by_key(keys, array('q', self.amounts)),
+            self.expected(keys)
+        )
+
+    def test_sum_larger_than_int64(self):
+        amounts = [2 ** 62] * 5000
+        self.assertEqual(sum_by_key(['zł'] * 5000, amounts), {'zł': 5000 * 2 ** 62})
+
+    def test_amounts_larger_than_int64(self):
+        self.amounts[0] = 2 ** 70
+        self.assertEqual(sum_by_key(self.keys, self.amounts), self.expected(self.keys))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+import unittest
+import os
+import socket
+import tempfile
+from datetime import date
+
+from fin import currency
+from fin import RatesError
+from fin import MissingRatesError
+from fin.money.currency import ChainedProvider
+from fin.money.currency import DictProvider
+from fin.money.currency import FileProvider
+from fin.money.currency import HttpProvider
+from fin.money.currency import RatesProvider
+
+
+RATES = {'2015-01-02': {'PLN': 4.3, 'USD': 1.2}}
+CSV = '''Date, USD, JPY, PLN,
+2015-01-02, 1.2, N/A, 4.3,
+2015-01-05, 1.19, 143.5, 4.31,
+'''
+
+
+class CountingProvider(RatesProvider):
+    def __init__(self, error):
+        super().__init__()
+        self.error = error
+        self.calls = 0
+
+    def fetch(self, date):
+        self.calls += 1
+        raise self.error
+
+
+def unused_url():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        port = s.getsockname()[1]
+    return 'http://127.0.0.1:{}'.format(port)
+
+
+class DictProviderTest(unittest.TestCase):
+    def test_rates(self):
+        provider = DictProvider(RATES)
+        self.assertEqual(provider.rates(date(2015, 1, 2)), {'PLN': 4.3, 'USD': 1.2})
+        self.assertIs(provider.selected, provider)
+        self.assertGreaterEqual(provider.latency, 0)
+
+    def test_missing_date(self):
+        with self.assertRaisesRegex(RatesError, "No conversion rates at date: '2015-01-03'"):
+            DictProvider(RATES).rates(date(2015, 1, 3))
+
+
+class FileProviderTest(unittest.TestCase):
+    def write(self, suffix, content):
+        f = tempfile.NamedTemporaryFile('w', suffix=suffix, delete=False, encoding='utf-8')
+        with f:
+            f.write(content)
+        self.addCleanup(os.remove, f.name)
+        return f.name
+
+    def test_csv(self):
+        provider = FileProvider(self.write('.csv', CSV))
+        self.assertEqual(provider.rates(date(2015, 1, 2)), {'USD': 1.2, 'PLN': 4.3})
+        self.assertEqual(
+            provider.rates(date(2015, 1, 5)),
+            {'USD': 1.19, 'JPY': 143.5, 'PLN': 4.31}
+        )
+
+    def test_json(self):
+        provider = FileProvider(self.write('.json', '{"2015-01-02": {"PLN": 4.3}}'))
+        self.assertEqual(provider.rates(date(2015, 1, 2)), {'PLN': 4.3})
+
+    def test_file_is_read_when_needed(self):
+        provider = FileProvider('does/not/exist.csv')
+        with self.assertRaisesRegex(RatesError, "Couldn't read conversion rates from 'does/not/exist.csv'"):
+            provider.rates(date(2015, 1, 2))
+
+    def test_invalid_file(self):
+        with self.assertRaises(RatesError):
+            FileProvider(self.write('.json', '{"2015-01-02": ')).rates(date(2015, 1, 2))
+
+
+class HttpProviderTest(unittest.TestCase):
+    def test_unreachable(self):
+        with self.assertRaisesRegex(RatesError, "Couldn't download conversion rates for base: 'EUR'"):
+            HttpProvider(unused_url(), timeout=1).rates(date(2015, 1, 2))
+
+
+class ChainedProviderTest(unittest.TestCase):
+    def test_falls_back_to_next_provider(self):
+        fallback = DictProvider(RATES)
+        provider = ChainedProvider(HttpProvider(unused_url(), timeout=1), fallback)
+        self.assertEqual(provider.rates(date(2015, 1, 2)), RATES['2015-01-02'])
+        self.assertIs(provider.selected, fallback)
+        self.assertGreaterEqual(provider.latency, fallback.latency)
+
+    def test_falls_back_from_missing_file(self):
+        provider = ChainedProvider(FileProvider('does/not/exist.csv'), DictProvider(RATES))
+        self.assertEqual(provider.rates(date(2015, 1, 2)), RATES['2015-01-02'])
+
+    def test_failed_provider_is_skipped(self):
+        failing = CountingProvider(RatesError('down'))
+        provider = ChainedProvider(failing, DictProvider(RATES))
+        provider.rates(date(2015, 1, 2))
+        provider.rates(date(2015, 1, 2))
+        self.assertEqual(failing.calls, 1)
+        failing.retry_after = 0
+        provider.rates(date(2015, 1, 2))
+        self.assertEqual(failing.calls, 2)
+
+    def test_failure_of_one_date_doesnt_stop_the_chain(self):
+        failing = CountingProvider(RatesError('down'))
+        provider = ChainedProvider(DictProvider(RATES), failing)
+        with self.assertRaises(RatesError):
+            provider.rates(date(2015, 1, 3))
+        self.assertEqual(provider.rates(date(2015, 1, 2)), RATES['2015-01-02'])
+        with self.assertRaisesRegex(RatesError, "at date: '2015-01-05', because provider failed recently: down"):
+            provider.rates(date(2015, 1, 5))
+        self.assertEqual(failing.calls, 1)
+
+    def test_missing_rates_are_not_failures(self):
+        missing = CountingProvider(MissingRatesError('no rates'))
+        provider = ChainedProvider(missing, DictProvider(RATES))
+        provider.rates(date(2015, 1, 2))
+        provider.rates(date(2015, 1, 2))
+        self.assertEqual(missing.calls, 2)
+
+    def test_all_providers_fail(self):
+        provider = ChainedProvider(DictProvider({}), DictProvider({}))
+        with self.assertRaisesRegex(RatesError, "No conversion rates at date: '2015-01-02'; No"):
+            provider.rates(date(2015, 1, 2))
+        self.assertIsNone(provider.selected)
+
+
+class SetupProviderTest(unittest.TestCase):
+    def setUp(self):
+        self.provider = currency.setup_provider(DictProvider(RATES))
+        self.cache_path = currency.cache_path
+        currency.setup_cache(None)
+        currency.cache = {}
+
+    def tearDown(self):
+        currency.setup_provider(self.provider)
+        currency.setup_cache(self.cache_path)
+        currency.cache = {}
+
+    def test_convert_offline(self):
+        self.assertAlmostEqual(currency.convert(12, 'USD', 'PLN', date(2015, 1, 2)), 43)
+
+    def test_unsupported_currency(self):
+        with self.assertRaises(RatesError):
+            currency.convert(1, 'JPY', 'PLN', date(2015, 1, 2))
+
+    def test_convert_at_day_without_rates(self):
+        saturday = date(2015, 1, 3)
+        self.assertAlmostEqual(currency.convert(12, 'USD', 'PLN', saturday), 43)
+        self.assertEqual(sorted(currency.cache), ['2015-01-02'])
+        self.assertEqual(list(currency._stale_rates), ['2015-01-03'])
+        currency.setup_provider(DictProvider({}))
+        self.assertAlmostEqual(currency.convert(10, 'PLN', 'EUR', date(2015, 1, 5)), 10 / 4.3)
+        with self.assertRaises(RatesError):
+            currency.convert(10, 'PLN', 'EUR', date(2015, 1, 6))
+
+    def test_timeline_is_built_from_cache(self):
+        currency.cache = {'2015-01-02': {'EUR': {'PLN': 4.0}}}
+        currency.setup_provider(DictProvider({}))
+        self.assertEqual(currency.convert(2, 'EUR', 'PLN', date(2015, 1, 4)), 8.0)
+
+    def test_quoted_day_after_day_without_quotes(self):
+        currency.setup_provider(DictProvider({
+            '2015-01-02': {'PLN': 4.0},
+            '2015-01-05': {'PLN': 5.0},
+        }))
+        self.assertEqual(currency.convert(1, 'EUR', 'PLN', date(2015, 1, 2)), 4.0)
+        self.assertEqual(currency.convert(1, 'EUR', 'PLN', date(2015, 1, 4)), 4.0)
+        self.assertEqual(currency.convert(1, 'EUR', 'PLN', date(2015, 1, 5)), 5.0)
+
+    def test_quote_published_later_replaces_stale_rates(self):
+        rates = {'2015-01-02': {'PLN': 4.0}}
+        currency.setup_provider(DictProvider(rates))
+        self.assertEqual(currency.convert(1, 'EUR', 'PLN', date(2015, 1, 3)), 4.0)
+        rates['2015-01-03'] = {'PLN': 5.0}
+        self.assertEqual(currency.convert(1, 'EUR', 'PLN', date(2015, 1, 3)), 4.0)
+        stale_ttl, currency.stale_ttl = currency.stale_ttl, 0
+        self.addCleanup(setattr, currency, 'stale_ttl', stale_ttl)
+        self.assertEqual(currency.convert(1, 'EUR', 'PLN', date(2015, 1, 3)), 5.0)
+
+    def test_prefetch_rates_of_nearest_earlier_day(self):
+        currency.prefetch([(date(2015, 1, 2), 'PLN'), (date(2015, 1, 4), 'USD')])
+        self.assertEqual(sorted(currency.cache), ['2015-01-02'])
+        self.assertEqual(currency._stale_rates['2015-01-04'][1], RATES['2015-01-02'])
+
+    def test_prefetch_keeps_rates_when_some_dates_fail(self):
+        class FailingProvider(DictProvider):
+            def fetch(self, date):
+                if date.day == 6:
+                    raise RatesError('down')
+                return super().fetch(date)
+        rates = {'2015-01-05': {'PLN': 4.0}, '2015-01-07': {'PLN': 4.1}}
+        currency.setup_provider(FailingProvider(rates, retry_after=0))
+        with self.assertRaisesRegex(RatesError, "of 1 dates, first error: down"):
+            currency.prefetch((date(2015, 1, day), 'PLN') for day in range(5, 8))
+        self.assertEqual(sorted(currency.cache), ['2015-01-05', '2015-01-07'])
+
+    def test_prefetch_every_quoted_day(self):
+        rates = {'2015-01-{:02d}'.format(day): {'PLN': 4 + day / 100} for day in range(5, 10)}
+        currency.setup_provider(DictProvider(rates))
+        currency.prefetch((date(2015, 1, day), 'PLN') for day in range(5, 10))
+        self.assertEqual(
+            {date_key: tables['EUR'] for date_key, tables in currency.cache.items()},
+            rates
+        )
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+import unittest
+from datetime import date
+from datetime import datetime
+
+from fin.money.rate_timeline import RateTimeline
+
+
+class RateTimelineTest(unittest.TestCase):
+    def setUp(self):
+        self.timeline = RateTimeline()
+        self.timeline.load([
+            (date(2015, 1, 9), {'PLN': 4.3, 'USD': 1.18}),
+            (date(2015, 1, 2), {'PLN': 4.29, 'USD': 1.2}),
+            (date(2015, 1, 5), {'PLN': 4.31}),
+        ])
+
+    def test_rate_at_quoted_day(self):
+        self.assertEqual(self.timeline.rate('PLN', date(2015, 1, 5)), 4.31)
+        self.assertEqual(self.timeline.rate('USD', datetime(2015, 1, 9, 12)), 1.18)
+
+    def test_rate_of_nearest_earlier_day(self):
+        self.assertEqual(self.timeline.rate('PLN', date(2015, 1, 4)), 4.29)
+        self.assertEqual(self.timeline.rate('PLN', date(2015, 1, 8)), 4.31)
+        self.assertEqual(self.timeline.rate('USD', date(2015, 1, 5)), 1.2)
+
+    def test_max_staleness(self):
+        self.assertIsNone(self.timeline.rate('USD', date(2015, 1, 6)))
+        self.assertEqual(self.timeline.rate('USD', date(2015, 1, 6), max_staleness=4), 1.2)
+        self.assertIsNone(RateTimeline(0).rate('PLN', date(2015, 1, 4)))
+
+    def test_no_rate(self):
+        self.assertIsNone(self.timeline.rate('PLN', date(2015, 1, 1)))
+        self.assertIsNone(self.timeline.rate('JPY', date(2015, 1, 2)))
+
+    def test_add(self):
+        self.timeline.add(date(2015, 1, 5), {'PLN': 4.4, 'USD': 1.19})
+        self.timeline.add(date(2015, 1, 1), {'PLN': 4.28})
+        self.assertEqual(self.timeline.rate('PLN', date(2015, 1, 5)), 4.4)
+        self.assertEqual(self.timeline.rate('USD', date(2015, 1, 7)), 1.19)
+        self.assertEqual(self.timeline.rate('PLN', date(2015, 1, 1)), 4.28)
+        self.assertEqual(len(self.timeline), 2)
+        self.assertIn('USD', self.timeline)
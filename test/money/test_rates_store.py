@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+import unittest
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stdout
+from datetime import date
+
+from fin import currency
+from fin.money.currency import DictProvider
+from fin.money.rates_store import RatesStore
+from fin.money.rates_store import main
+
+
+class RatesStoreTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.path = os.path.join(self.directory, 'rates.sqlite')
+        self.store = RatesStore(self.path)
+        self.addCleanup(self.store.close)
+
+    def test_put_and_get(self):
+        self.store.put('2015-01-02', 'EUR', {'PLN': 4.3})
+        self.assertEqual(self.store.get('2015-01-02', 'EUR'), {'PLN': 4.3})
+        self.assertIsNone(self.store.get('2015-01-02', 'PLN'))
+        self.assertIsNone(self.store.get('2015-01-03', 'EUR'))
+        self.assertEqual(len(self.store), 1)
+
+    def test_entries_are_written_immediately(self):
+        other = RatesStore(self.path)
+        self.addCleanup(other.close)
+        self.store.put('2015-01-02', 'EUR', {'PLN': 4.3})
+        self.assertEqual(other.get('2015-01-02', 'EUR'), {'PLN': 4.3})
+        other.put('2015-01-02', 'EUR', {'PLN': 4.4})
+        self.assertEqual(self.store.get('2015-01-02', 'EUR'), {'PLN': 4.4})
+
+    def test_range(self):
+        self.store.put_many([
+            ('2015-01-05', 'EUR', {'PLN': 4.31}),
+            ('2015-01-02', 'EUR', {'PLN': 4.3}),
+            ('2015-01-02', 'PLN', {'EUR': 0.23}),
+            ('2015-01-01', 'EUR', {'PLN': 4.29}),
+        ])
+        self.assertEqual(self.store.range('2015-01-02', '2015-01-04'), [
+            ('2015-01-02', 'EUR', {'PLN': 4.3}),
+            ('2015-01-02', 'PLN', {'EUR': 0.23}),
+        ])
+
+    def test_import_json(self):
+        path = os.path.join(self.directory, 'rates.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'2015-01-02': {'EUR': {'PLN': 4.3}, 'PLN': {'EUR': 0.23}}}, f)
+        self.assertEqual(self.store.import_json(path), 2)
+        self.assertEqual(self.store.get('2015-01-02', 'PLN'), {'EUR': 0.23})
+
+    def test_compact(self):
+        self.store.put_many(('2015-01-{:02d}'.format(d), 'EUR', {'PLN': d}) for d in range(1, 29))
+        self.store.compact()
+        self.assertEqual(len(self.store), 28)
+        self.assertEqual(os.path.getsize(self.path + '-wal'), 0)
+
+    def test_compact_command(self):
+        self.store.put('2015-01-02', 'EUR', {'PLN': 4.3})
+        with redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(main(['rates_store', 'compact', self.path]), 0)
+        self.assertIn(self.path, output.getvalue())
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(main(['rates_store']), 2)
+
+
+class CurrencyCacheTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.provider = currency.setup_provider(DictProvider({}))
+        self.cache_path = currency.cache_path
+        currency.setup_cache(None)
+        currency.cache = {}
+
+    def tearDown(self):
+        currency.setup_cache(self.cache_path)
+        currency.setup_provider(self.provider)
+        currency.cache = {}
+
+    def test_rates_are_read_when_needed(self):
+        store = RatesStore(os.path.join(self.directory, 'rates.sqlite'))
+        store.put('2015-01-02', 'EUR', {'PLN': 4.0})
+        store.put('2015-02-02', 'EUR', {'PLN': 4.5})
+        store.close()
+        currency.setup_cache(os.path.join(self.directory, 'rates.sqlite'))
+        self.assertEqual(currency.convert(2, 'EUR', 'PLN', date(2015, 1, 4)), 8.0)
+        self.assertEqual(sorted(currency.cache), ['2015-01-02'])
+
+    def test_stale_rates_are_not_stored(self):
+        path = os.path.join(self.directory, 'rates.sqlite')
+        rates = {'2015-01-02': {'PLN': 4.0}}
+        currency.setup_provider(DictProvider(rates))
+        currency.setup_cache(path)
+        self.assertEqual(currency.convert(1, 'EUR', 'PLN', date(2015, 1, 3)), 4.0)
+        rates['2015-01-03'] = {'PLN': 5.0}
+        currency.cache = {}
+        currency.setup_cache(path)
+        self.assertEqual(currency.convert(1, 'EUR', 'PLN', date(2015, 1, 3)), 5.0)
+
+    def test_only_quotes_in_reference_currency_are_stored(self):
+        path = os.path.join(self.directory, 'rates.sqlite')
+        store = RatesStore(path)
+        store.put('2015-01-03', '~EUR', {'PLN': 4.0})
+        store.close()
+        currency.setup_cache(path)
+        currency._store_rates('2015-01-02', 'PLN', {'EUR': 0.25})
+        currency.setup_provider(DictProvider({'2015-01-03': {'PLN': 5.0}}))
+        self.assertEqual(currency.convert(1, 'EUR', 'PLN', date(2015, 1, 3)), 5.0)
+        self.assertNotIn('~EUR', currency.cache['2015-01-03'])
+        self.assertEqual(
+            sorted((date_key, base) for date_key, base, rates in currency.store.range('2015-01-02', '2015-01-03')),
+            [('2015-01-03', 'EUR'), ('2015-01-03', '~EUR')]
+        )
+
+    def test_downloaded_rates_are_stored(self):
+        currency.setup_provider(DictProvider({'2015-01-02': {'PLN': 4.0}}))
+        currency.setup_cache(os.path.join(self.directory, 'rates.sqlite'))
+        currency.prefetch([(date(2015, 1, 2), 'PLN')])
+        store = RatesStore(os.path.join(self.directory, 'rates.sqlite'))
+        self.addCleanup(store.close)
+        self.assertEqual(store.get('2015-01-02', 'EUR'), {'PLN': 4.0})
+
+    def test_migrates_json_cache(self):
+        path = os.path.join(self.directory, 'currency.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'2015-01-02': {'PLN': {'USD': 0.3}}}, f)
+        currency.setup_cache(path)
+        self.assertEqual(currency.store.path, os.path.join(self.directory, 'currency.sqlite'))
+        self.assertEqual(currency.convert(10, 'PLN', 'USD', date(2015, 1, 2)), 3.0)
+
+    def test_database_that_cant_be_opened(self):
+        currency.setup_cache(os.path.join(self.directory, 'missing', 'rates.sqlite'))
+        self.assertIsNone(currency.store)
+        currency.setup_provider(DictProvider({'2015-01-02': {'PLN': 4.0}}))
+        self.assertEqual(currency.convert(2, 'EUR', 'PLN', date(2015, 1, 2)), 8.0)
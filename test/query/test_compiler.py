@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+import unittest
+from datetime import datetime
+from unittest import mock
+from fin import Transaction
+from fin import Transactions
+from fin import query
+from fin.query import Query
+from fin.query import compiler
+from fin.query.compiler import compile_query
+from fin.query.query_parser import parse_query
+
+
+TRANSACTIONS = [
+    Transaction('2016-01-01 food(soup) shared 10zł'),
+    Transaction('2016-01-02 Food(bread) 5zł'),
+    Transaction('2016-01-03 bus 2€'),
+    Transaction('2016-01-04 food(cake) shared(john) 3zł'),
+]
+
+
+class CompilerTest(unittest.TestCase):
+    def test_same_result_as_tree(self):
+        for text in (
+            'food',
+            'not food',
+            'food and not shared',
+            'bus or shared',
+            'food = bread',
+            'food != bread',
+            'food ^= ca',
+            'food *= rea',
+            'food $= ad',
+            'shared = john and food',
+            'currency = €',
+            'currency != zł or bus',
+            'date < 2016-01-03',
+            'date = 2016-01-02',
+            'date >= 2016-01-02 and date <= 2016-01-03',
+            'not date > 2016-01-01',
+            'date',
+            '"food"',
+        ):
+            tree = parse_query(text)
+            compiled = compile_query(tree)
+            for transaction in TRANSACTIONS:
+                self.assertEqual(
+                    bool(compiled(transaction)), bool(tree(transaction)),
+                    '{} for {}'.format(text, transaction)
+                )
+
+    def test_query_is_compiled(self):
+        compiled = query('food and not shared')
+        self.assertIsInstance(compiled, Query)
+        self.assertEqual(str(compiled), '(food and (not shared))')
+        self.assertEqual(
+            [bool(compiled(t)) for t in TRANSACTIONS],
+            [False, True, False, False]
+        )
+
+    def test_node_compile(self):
+        self.assertTrue(parse_query('bus').compile()(TRANSACTIONS[2]))
+
+
+class ConstantsTest(unittest.TestCase):
+    def test_right_sides_are_parsed_once(self):
+        transactions = TRANSACTIONS * 10
+        with mock.patch.object(compiler, 'parse_date', wraps=compiler.parse_date) as parse_date:
+            predicate = query('date >= 2016-01-02 and date < 2016-01-04')
+            self.assertEqual(sum(1 for t in transactions if predicate(t)), 20)
+        self.assertEqual(parse_date.call_count, 2)
+        with mock.patch.object(compiler, 'Money', wraps=compiler.Money) as money:
+            predicate = query('money = 5zł or money = 3zł')
+            self.assertEqual(sum(1 for t in transactions if predicate(t)), 20)
+        self.assertEqual(money.call_count, 2)
+
+    def test_now_is_pinned(self):
+        predicate = Query(parse_query('date = yesterday'), now=datetime(2016, 1, 3, 12))
+        self.assertEqual(predicate.now, datetime(2016, 1, 3, 12))
+        self.assertEqual(
+            [bool(predicate(t)) for t in TRANSACTIONS],
+            [False, True, False, False]
+        )
+
+    def test_rebind(self):
+        predicate = Query(parse_query('date = yesterday'), now=datetime(2016, 1, 3))
+        predicate(TRANSACTIONS[0])
+        self.assertIs(predicate.rebind(datetime(2016, 1, 5)), predicate)
+        self.assertEqual(
+            [bool(predicate(t)) for t in TRANSACTIONS],
+            [False, False, False, True]
+        )
+
+    def test_indexed_filter_uses_pinned_now(self):
+        predicate = Query(parse_query('date >= yesterday'), now=datetime(2016, 1, 4))
+        self.assertEqual(
+            str(Transactions(TRANSACTIONS).filter(predicate)),
+            '2016-01-03 bus 2,00 €\n'
+            '2016-01-04 food(cake) shared(john) 3,00 zł'
+        )
@@ -0,0 +1,59 @@
+import unittest
+from datetime import datetime
+from unittest import mock
+from fin.query import parse_date as parse_date_module
+from fin.query.parse_date import parse_date
+from fin.query.parse_date import date_cache
+from fin.query.parse_date import depends_on_time
+
+
+class ParseDateCacheTest(unittest.TestCase):
+    def setUp(self):
+        date_cache.clear()
+        depends_on_time.clear()
+
+    def test_caches_dates_of_the_same_day(self):
+        self.assertEqual(
+            parse_date('yesterday', datetime(2016, 3, 2, 10)),
+            datetime(2016, 3, 1)
+        )
+        self.assertEqual(
+            parse_date('yesterday', datetime(2016, 3, 2, 18)),
+            datetime(2016, 3, 1)
+        )
+        self.assertEqual((date_cache.hits, date_cache.misses), (1, 1))
+
+    def test_other_day_is_parsed_again(self):
+        parse_date('yesterday', datetime(2016, 3, 2, 10))
+        self.assertEqual(
+            parse_date('yesterday', datetime(2016, 3, 3, 10)),
+            datetime(2016, 3, 2)
+        )
+        self.assertEqual(date_cache.hits, 0)
+
+    def test_doesnt_cache_dates_depending_on_time(self):
+        self.assertEqual(
+            parse_date('now', datetime(2016, 3, 2, 10)),
+            datetime(2016, 3, 2, 10)
+        )
+        self.assertEqual(
+            parse_date('now', datetime(2016, 3, 2, 18)),
+            datetime(2016, 3, 2, 18)
+        )
+        self.assertEqual(len(date_cache), 0)
+
+    def test_dates_depending_on_time_are_parsed_once(self):
+        parse_date('now', datetime(2016, 3, 2, 10))
+        parses = []
+
+        class CountingParser(parse_date_module.Parser):
+            def parse(self, text, now=None):
+                parses.append(text)
+                return super().parse(text, now)
+
+        with mock.patch.object(parse_date_module, 'Parser', CountingParser):
+            self.assertEqual(
+                parse_date('now', datetime(2016, 3, 2, 11)),
+                datetime(2016, 3, 2, 11)
+            )
+        self.assertEqual(parses, ['now'])
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+import unittest
+from fin import Transactions
+from fin import query
+from fin.query import plan
+
+
+TRANSACTIONS = Transactions('''2016-01-01 food shared 10zł
+2016-01-02 food 5zł
+2016-01-03 bus 2zł
+2016-01-04 food 3zł
+2016-01-05 food 2€
+''')
+
+
+class PlannerTest(unittest.TestCase):
+    def test_cheap_operands_go_first(self):
+        self.assertEqual(
+            str(plan(query('money > 100€ and food'))),
+            '(food and (money > 100€))'
+        )
+        self.assertEqual(
+            str(plan(query('money > 100€ or food'))),
+            '(food or (money > 100€))'
+        )
+
+    def test_only_commutative_chains_are_reordered(self):
+        self.assertEqual(
+            str(plan(query('(money > 100€ or bus) and food'))),
+            '(food and (bus or (money > 100€)))'
+        )
+        self.assertEqual(
+            str(plan(query('not (money > 100€ and food)'))),
+            '(not (food and (money > 100€)))'
+        )
+
+    def test_uses_selectivity_of_index(self):
+        self.assertEqual(
+            str(plan(query('food and bus'), TRANSACTIONS)),
+            '(bus and food)'
+        )
+        self.assertEqual(
+            str(plan(query('bus or food'), TRANSACTIONS)),
+            '(food or bus)'
+        )
+
+    def test_date_ranges_go_first(self):
+        self.assertEqual(
+            str(plan(query('food and date >= 2016-01-02 and shared and date < 2016-01-04'), TRANSACTIONS)),
+            '((((date >= 2016-01-02) and (date < 2016-01-04)) and shared) and food)'
+        )
+
+    def test_estimates(self):
+        planned = plan(query('food and currency = zł'), TRANSACTIONS)
+        self.assertEqual(planned.access, 'scan')
+        self.assertEqual(planned.left.access, 'index')
+        self.assertEqual(planned.left.selectivity, 0.8)
+        self.assertAlmostEqual(planned.cost, 0.01 + 0.8 * 3)
+        self.assertAlmostEqual(planned.selectivity, 0.08)
+
+    def test_explain(self):
+        self.assertEqual(
+            query('currency = zł and not shared').explain(TRANSACTIONS),
+            'and scan (cost 2.41, selectivity 0.08)\n'
+            '  not index (cost 0.01, selectivity 0.8)\n'
+            '    shared index (cost 0.01, selectivity 0.2)\n'
+            '  (currency = zł) scan (cost 3, selectivity 0.1)'
+        )
+
+    def test_same_result_as_written_order(self):
+        for text in (
+            'currency = zł and food',
+            'currency = € or bus',
+            'food and date >= 2016-01-02 and not shared',
+            'not (bus or shared) and currency = zł',
+        ):
+            predicate = query(text)
+            self.assertEqual(
+                [str(t) for t in TRANSACTIONS.filter(text)],
+                [str(t) for t in TRANSACTIONS if predicate(t)],
+                text
+            )
+
+    def test_cached_trees_are_not_changed(self):
+        shared = query('food and currency = zł')
+        planned = plan(shared, TRANSACTIONS)
+        self.assertIsNot(planned, shared.tree)
+        for node in (shared.tree, shared.tree.left, shared.tree.right):
+            self.assertFalse(hasattr(node, 'selectivity'))
+        self.assertIs(query('food and currency = zł').tree, shared.tree)
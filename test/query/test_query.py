@@ -2,7 +2,9 @@
 import unittest
 import datetime
 from fin import query
+from fin.query.query import query_cache
 from fin import Transaction
+from fin import Transactions
 
 
 class QueryTest(unittest.TestCase):
@@ -200,5 +202,26 @@ class QueryTest(unittest.TestCase):
         )
 
 
+class LongQueryTest(unittest.TestCase):
+    def test_long_or_chain(self):
+        text = ' or '.join('tag{}'.format(i) for i in range(3000))
+        self.assertTrue(query(text)(Transaction('2016-01-01 tag2999 10zł')))
+        self.assertFalse(query(text)(Transaction('2016-01-01 foo 10zł')))
+        self.assertEqual(
+            str(Transactions('2016-01-01 tag2999 10zł\n2016-01-01 foo 10zł').filter(text)),
+            '2016-01-01 tag2999 10,00 zł'
+        )
+
+
+class QueryCacheTest(unittest.TestCase):
+    def test_parsed_tree_is_reused(self):
+        query_cache.clear()
+        first = query('cached and query')
+        second = query('cached and query')
+        self.assertIs(first.tree, second.tree)
+        self.assertIsNot(first, second)
+        self.assertEqual((query_cache.hits, query_cache.misses), (1, 1))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -114,6 +114,11 @@ class QueryParserTest(unittest.TestCase):
             '(not q)'
         )
 
+    def test_long_chain(self):
+        tree = QueryParser().run(' or '.join('tag{}'.format(i) for i in range(5000)))
+        self.assertEqual(tree.operator, 'or')
+        self.assertEqual(tree.right.value, 'tag4999')
+
     def test_missing_right(self):
         with self.assertRaises(QueryParseError) as cm:
             self.parse('test ='),
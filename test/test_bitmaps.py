@@ -0,0 +1,28 @@
+import unittest
+from fin import bitmaps
+
+
+class BitmapsTest(unittest.TestCase):
+    def test_full(self):
+        self.assertEqual(bitmaps.full(0), 0)
+        self.assertEqual(bitmaps.full(3), 0b111)
+
+    def test_from_rows(self):
+        self.assertEqual(bitmaps.from_rows([0, 3, 5], 6), 0b101001)
+        self.assertEqual(bitmaps.from_rows([], 6), 0)
+        self.assertEqual(bitmaps.from_rows([8], 9), 1 << 8)
+
+    def test_iter_rows(self):
+        self.assertEqual(list(bitmaps.iter_rows(0b101001)), [0, 3, 5])
+        self.assertEqual(list(bitmaps.iter_rows(0)), [])
+
+    def test_matching(self):
+        evaluated = []
+
+        def predicate(item):
+            evaluated.append(item)
+            return item > 5
+
+        items = list(range(9))
+        self.assertEqual(bitmaps.matching(predicate, items, 0b101000011), 0b101000000)
+        self.assertEqual(evaluated, [0, 1, 6, 8])
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from fin import Transactions
+from fin import Money
+from fin import query
+from fin.intern import InternTable
+from fin.intern import setup_intern_table
+
+
+class InternTableTest(unittest.TestCase):
+    def test_intern(self):
+        table = InternTable()
+        first = ''.join(['fo', 'od'])
+        second = ''.join(['foo', 'd'])
+        self.assertIsNot(first, second)
+        self.assertIs(table.intern(first), first)
+        self.assertIs(table.intern(second), first)
+        self.assertEqual(len(table), 1)
+
+    def test_index(self):
+        table = InternTable()
+        self.assertEqual(table.index('food'), 0)
+        self.assertEqual(table.index('bus'), 1)
+        self.assertEqual(table.index('food'), 0)
+        self.assertEqual(table.strings, ['food', 'bus'])
+        self.assertTrue('bus' in table)
+        self.assertFalse('car' in table)
+
+    def test_lower(self):
+        table = InternTable()
+        self.assertEqual(table.lower('Food'), 'food')
+        self.assertIs(table.lower('Food'), table.intern('food'))
+
+    def test_max_size(self):
+        table = InternTable(max_size=2)
+        table.intern('food')
+        table.intern('bus')
+        self.assertEqual(len(table), 2)
+        table.intern('food')
+        self.assertEqual(len(table), 2)
+        table.intern('car')
+        self.assertEqual(table.strings, ['car'])
+        self.assertEqual(table.lower('Rent'), 'rent')
+        self.assertLessEqual(len(table), 2)
+
+    def test_index_from_many_threads(self):
+        table = InternTable()
+        texts = [str(i % 100) for i in range(10000)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            ids = list(executor.map(table.index, texts))
+        self.assertEqual(len(table), 100)
+        for text, id in zip(texts, ids):
+            self.assertEqual(table.strings[id], text)
+
+
+class ParsersInterningTest(unittest.TestCase):
+    def setUp(self):
+        self.previous = setup_intern_table(InternTable())
+
+    def tearDown(self):
+        setup_intern_table(self.previous)
+
+    def test_tags_and_currencies_are_shared(self):
+        transactions = Transactions(
+            '2016-01-02 food 10zł\n'
+            '2016-01-03 food 5zł\n'
+            '2016-01-04 food(bread) 5zł\n'
+            '2016-01-05 food 5 zł\n'
+        )
+        tags = [next(iter(t.tags)) for t in transactions]
+        currencies = [next(iter(t.money.currencies())) for t in transactions]
+        for tag in tags:
+            self.assertIs(tag, tags[0])
+        for currency in currencies:
+            self.assertIs(currency, currencies[0])
+        self.assertIs(next(iter(Money('1zł').currencies())), currencies[0])
+
+    def test_interning_can_be_disabled(self):
+        setup_intern_table(None)
+        transactions = Transactions(
+            '2016-01-02 Food 10zł\n'
+            '2016-01-03 food 5zł\n'
+        )
+        self.assertEqual(len(transactions.filter(query('food'))), 2)
+
+    def test_query_uses_lowered_tags(self):
+        transactions = Transactions(
+            '2016-01-02 Food 10zł\n'
+            '2016-01-03 bus 5zł\n'
+        )
+        self.assertEqual(len(transactions.filter(query('FOOD'))), 1)
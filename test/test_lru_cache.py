@@ -0,0 +1,57 @@
+import unittest
+from threading import Thread
+from fin.lru_cache import LRUCache
+
+
+class LRUCacheTest(unittest.TestCase):
+    def test_get_and_put(self):
+        cache = LRUCache(2)
+        self.assertIsNone(cache.get('a'))
+        cache.put('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_removes_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertTrue('a' in cache)
+        self.assertFalse('b' in cache)
+        self.assertTrue('c' in cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_get_or_compute(self):
+        cache = LRUCache(2)
+        computed = []
+
+        def compute(key):
+            computed.append(key)
+            return key * 2
+
+        self.assertEqual(cache.get_or_compute('a', compute), 'aa')
+        self.assertEqual(cache.get_or_compute('a', compute), 'aa')
+        self.assertEqual(computed, ['a'])
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_clear(self):
+        cache = LRUCache(2)
+        cache.get_or_compute('a', str)
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+    def test_threads(self):
+        cache = LRUCache(10)
+
+        def use():
+            for i in range(1000):
+                cache.get_or_compute(i % 20, str)
+
+        threads = [Thread(target=use) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(cache.hits + cache.misses, 4000)
+        self.assertEqual(len(cache), 10)
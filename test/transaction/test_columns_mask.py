@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+import unittest
+from datetime import datetime
+
+from fin import TransactionsColumns
+from fin import query
+from fin.transaction import columns_mask
+from fin.transaction.columns_mask import ColumnsMask
+from fin.transaction.columns_mask import query_mask
+
+
+COLUMNS = TransactionsColumns('''2016-01-01 food(soup) Shared 10zł
+2016-01-02 food(curry) 5zł + 1€
+2016-01-02 bus 2zł
+2016-01-04 food(pizza) 3zł
+2016-01-05 Food 2€
+2016-01-06 rent 1$ + 1€
+''')
+
+
+@unittest.skipIf(columns_mask.numpy is None, 'numpy is not installed')
+class ColumnsMaskTest(unittest.TestCase):
+    def rows(self, text):
+        return columns_mask.numpy.flatnonzero(query_mask(query(text), COLUMNS)).tolist()
+
+    def expected(self, text):
+        predicate = query(text)
+        return [row for row, t in enumerate(COLUMNS) if predicate(t)]
+
+    def test_same_rows_as_per_row_evaluation(self):
+        for text in (
+            'food',
+            'shared or bus',
+            'not food',
+            'food and not shared',
+            'date >= 2016-01-02 and date < 2016-01-05',
+            'date = 2016-01-02 or date != 2016-01-04',
+            'money = 5zł',
+            'money != 2€',
+            'currency = zł',
+            'currency != €',
+            'currency = zł€',
+            'food = soup',
+            'food != pizza',
+            'food = ""',
+            'food ^= p',
+            'not (bus or food *= i) and currency = zł',
+        ):
+            self.assertEqual(self.rows(text), self.expected(text), text)
+
+    def test_dates_later_than_midnight(self):
+        mask = ColumnsMask(COLUMNS)
+        noon = datetime(2016, 1, 2, 12)
+        self.assertEqual(mask.date_relation('<', noon).tolist().count(True), 3)
+        self.assertEqual(mask.date_relation('<=', noon).tolist().count(True), 3)
+        self.assertEqual(mask.date_relation('>', noon).tolist().count(True), 3)
+        self.assertEqual(mask.date_relation('>=', noon).tolist().count(True), 3)
+        self.assertEqual(mask.date_relation('=', noon).tolist().count(True), 0)
+
+    def test_filter(self):
+        self.assertEqual(
+            [str(t) for t in COLUMNS.filter('food and date > 2016-01-01')],
+            [str(t) for t in COLUMNS.to_transactions().filter('food and date > 2016-01-01')]
+        )
+
+    def test_tag_masks_are_remembered(self):
+        columns = TransactionsColumns(str(COLUMNS))
+        query_mask(query('food'), columns)
+        self.assertEqual(list(columns._vectors.tag_masks), ['food'])
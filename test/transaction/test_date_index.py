@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+import unittest
+from datetime import datetime
+from fin import Transactions
+from fin import Transaction
+from fin import query
+from fin.bitmaps import iter_rows
+from fin.transaction.date_index import DateIndex
+
+
+TRANSACTIONS = Transactions('''2016-03-01 food 10zł
+2016-01-02 bus 5zł
+2016-02-15 food 2zł
+2016-01-02 rent 1000zł
+2016-02-01 food shared 4zł
+2016-02-29 cinema 20€
+2016-01-31 food 7zł
+''')
+
+
+class DateIndexTest(unittest.TestCase):
+    def test_sorted(self):
+        index = DateIndex(list(TRANSACTIONS))
+        self.assertEqual(list(index.rows), [1, 3, 6, 4, 2, 5, 0])
+        self.assertEqual(index.dates, sorted(t.date for t in TRANSACTIONS))
+
+    def test_bitmap(self):
+        index = DateIndex(list(TRANSACTIONS))
+        date = datetime(2016, 2, 1)
+        for operator, rows in (
+            ('<', [1, 3, 6]),
+            ('<=', [1, 3, 4, 6]),
+            ('=', [4]),
+            ('!=', [0, 1, 2, 3, 5, 6]),
+            ('>=', [0, 2, 4, 5]),
+            ('>', [0, 2, 5]),
+        ):
+            self.assertEqual(list(iter_rows(index.bitmap(operator, date))), rows, operator)
+        self.assertIsNone(index.bitmap('^=', date))
+
+    def test_keeps_time(self):
+        index = DateIndex([
+            Transaction(datetime(2016, 1, 1, 12), {}, None),
+            Transaction(datetime(2016, 1, 1), {}, None),
+        ])
+        self.assertEqual(list(iter_rows(index.bitmap('>', datetime(2016, 1, 1)))), [0])
+
+    def test_is_cached(self):
+        transactions = Transactions(list(TRANSACTIONS))
+        self.assertIs(transactions.date_index, transactions.date_index)
+
+
+class DateFilterTest(unittest.TestCase):
+    def assertSameAsPredicate(self, text):
+        predicate = query(text)
+        self.assertEqual(
+            [str(t) for t in TRANSACTIONS.filter(text)],
+            [str(t) for t in TRANSACTIONS if predicate(t)],
+            text
+        )
+
+    def test_same_result_as_evaluating_query(self):
+        for text in (
+            'date < 2016-02-01',
+            'date = 2016-01-02',
+            'date != 2016-01-02',
+            'date >= 2016-02-01 and date < 2016-03-01',
+            'date >= 2016-02-01 and date < 2016-03-01 and date > 2016-02-01',
+            'date > 2016-03-01 and date < 2016-01-01',
+            'food and date >= 2016-02-01',
+            'date >= 2016-02-01 and food',
+            'date < 2016-01-05 or shared',
+            'not date > 2016-02-01',
+        ):
+            self.assertSameAsPredicate(text)
+
+    def test_range_touches_only_rows_in_range(self):
+        transactions = Transactions(list(TRANSACTIONS))
+        self.assertEqual(
+            str(transactions.filter('date >= 2016-02-01 and date < 2016-03-01')),
+            '2016-02-15 food 2,00 zł\n'
+            '2016-02-01 food shared 4,00 zł\n'
+            '2016-02-29 cinema 20,00 €'
+        )
+        self.assertEqual(
+            query('date >= 2016-02-01 and date < 2016-03-01').tree.date_range(transactions),
+            (3, 6)
+        )
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+import unittest
+from fin import Transactions
+from fin import query
+from fin.transaction.tag_index import TagIndex
+
+
+TRANSACTIONS = Transactions('''2016-01-01 food shared 10zł
+2016-01-02 Food 5zł
+2016-01-03 bus 2zł
+2016-01-04 food(bread) 3,50zł
+2016-01-05 shared rent 1000zł
+2016-01-06 bus food 4zł
+2016-01-07 cinema 20€
+2016-01-08 food 7zł
+2016-01-09 food shared 12zł
+''')
+
+
+class TagIndexTest(unittest.TestCase):
+    def test_bitmap(self):
+        index = TagIndex(list(TRANSACTIONS))
+        self.assertEqual(index.bitmap('bus'), 0b000100100)
+        self.assertEqual(index.bitmap('food'), 0b110101011)
+        self.assertEqual(index.bitmap('car'), 0)
+
+    def test_is_cached(self):
+        transactions = Transactions(list(TRANSACTIONS))
+        self.assertIs(transactions.tag_index, transactions.tag_index)
+
+
+class IndexedFilterTest(unittest.TestCase):
+    def assertSameAsPredicate(self, text):
+        predicate = query(text)
+        self.assertEqual(
+            [str(t) for t in TRANSACTIONS.filter(text)],
+            [str(t) for t in TRANSACTIONS if predicate(t)],
+            text
+        )
+
+    def test_same_result_as_evaluating_query(self):
+        for text in (
+            'food',
+            'FOOD',
+            'car',
+            'not food',
+            'food and not shared',
+            'food or bus',
+            'not (food or bus)',
+            'food shared',
+            'bus or not food and shared',
+            'food and date > 2016-01-03',
+            'shared or date < 2016-01-03',
+            'not (food = bread)',
+            'currency = €',
+        ):
+            self.assertSameAsPredicate(text)
+
+    def test_keeps_order(self):
+        self.assertEqual(
+            str(TRANSACTIONS.filter('food and not shared')),
+            '2016-01-02 Food 5,00 zł\n'
+            '2016-01-04 food(bread) 3,50 zł\n'
+            '2016-01-06 bus food 4,00 zł\n'
+            '2016-01-08 food 7,00 zł'
+        )
@@ -6,6 +6,9 @@ from fin import Transaction
 from fin import TransactionParseError
 from fin import Money
 from fin import currency
+from fin.transaction.tags import Tags
+from fin.transaction.transaction_parser import parse_simple_transaction
+from fin.transaction.transaction_parser import parse_any_transaction
 
 
 def empty(*tags):
@@ -110,6 +113,64 @@ class TransactionParsingTest(unittest.TestCase):
             Money('-100zł')
         )
 
+
+class SimpleTransactionParsingTest(unittest.TestCase):
+    def assertSameAsAnyTransaction(self, text):
+        date, tags, money = parse_simple_transaction(text)
+        expected_date, expected_tags, expected_money = parse_any_transaction(text)
+        self.assertEqual(date, expected_date)
+        self.assertEqual(list(tags.items()), list(expected_tags.items()))
+        self.assertEqual(str(money), str(expected_money))
+
+    def test_simple_transactions(self):
+        for text in (
+            '2016-01-02 10zł',
+            '2016-01-02 10 zł',
+            '2016-01-02 t1 t2 10,5zł',
+            '2016-01-02  t1   t2 10.05 zł',
+            '2016-01-02 t1 t1 -10,50€',
+            '2016-01-02 03:04 t1 1 10zł',
+        ):
+            self.assertSameAsAnyTransaction(text)
+
+    def test_falls_back_for_other_transactions(self):
+        for text in (
+            '# comment',
+            '2016-01-02 t1(foo) 10zł',
+            '2016-01-02 t1\tt2 10zł',
+            '2016-01-02 t1 10zł+5€',
+            '2016-01-02 t1 10zł ',
+            '2016-13-02 t1 10zł',
+            '2016-01-02 t1 10',
+        ):
+            self.assertIsNone(parse_simple_transaction(text))
+
+
+class TagsTest(unittest.TestCase):
+    def test_mapping(self):
+        tags = Tags([('t1', None), ('t2', 'foo')])
+        self.assertEqual(list(tags), ['t1', 't2'])
+        self.assertEqual(list(tags.items()), [('t1', None), ('t2', 'foo')])
+        self.assertEqual(tags['t2'], 'foo')
+        self.assertEqual(tags.get('t3', ''), '')
+        self.assertTrue('t1' in tags)
+        self.assertFalse('t3' in tags)
+        self.assertEqual(tags, {'t2': 'foo', 't1': None})
+
+    def test_is_immutable(self):
+        tags = Tags.from_names(['t1'])
+        with self.assertRaises(TypeError):
+            tags['t1'] = 'foo'
+        with self.assertRaises(AttributeError):
+            tags.foo = 'bar'
+
+    def test_transaction_has_no_dict(self):
+        transaction = Transaction('2016-01-02 t1 t2 10 zł')
+        self.assertIsInstance(transaction.tags, Tags)
+        self.assertFalse(hasattr(transaction, '__dict__'))
+        self.assertFalse(hasattr(transaction.money, '__dict__'))
+
+
 class TransactionConversionTest(unittest.TestCase):
     def test_convert_currency(self):
         currency.cache = {
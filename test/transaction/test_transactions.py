@@ -1,10 +1,16 @@
 # -*- coding: utf-8 -*-
 import unittest
+import io
+import os
+import tempfile
 from fin import GroupedTransactions
 from fin import Transactions
 from fin import Transaction
 from fin import Money
+from fin import GroupedMoney
 from fin import TransactionParseError
+from fin import iter_transactions
+from fin.transaction.transactions_parser import iter_transactions_in_parallel
 
 
 class TransactionsTest(unittest.TestCase):
@@ -105,6 +111,73 @@ class TransactionsTest(unittest.TestCase):
 
     def test_group_with_query(self): pass
 
+    def test_aggregate(self):
+        transactions = Transactions("""
+2016-01-01 test1 10zł
+2016-01-02 test2 5,01€
+2016-01-03 test2 2€
+2016-02-01 test1 30zł
+2016-02-03 test1 25zł
+        """)
+        self.assertEqual(
+            transactions.aggregate('year-month'),
+            transactions.group('year-month').sum()
+        )
+        self.assertEqual(
+            transactions.aggregate('year-month', 'min'),
+            GroupedMoney({'2016-01': Money('10zł + 2€'), '2016-02': Money('25zł')})
+        )
+        self.assertEqual(
+            transactions.aggregate('year-month', 'max'),
+            GroupedMoney({'2016-01': Money('10zł + 5,01€'), '2016-02': Money('30zł')})
+        )
+        self.assertEqual(
+            transactions.aggregate('year-month', 'mean'),
+            GroupedMoney({'2016-01': Money('10zł + 3,50€'), '2016-02': Money('27,50zł')})
+        )
+        self.assertEqual(
+            dict(transactions.aggregate('year-month', 'count').items()),
+            {'2016-01': 3, '2016-02': 2}
+        )
+
+    def test_aggregate_with_unknown_reducer(self):
+        with self.assertRaises(ValueError):
+            Transactions('2016-01-01 test1 10zł').aggregate('year', 'median')
+
+    def test_group_by(self):
+        self.assertEqual(
+            Transactions("""
+2016-01-01 test1 10zł
+2016-02-01 test2 20zł
+2016-02-03 test1 30zł
+2017-01-01 test2 40zł
+        """).group_by('year', lambda t: t.date.strftime('%m')),
+            GroupedTransactions({
+                '2016': GroupedTransactions({
+                    '01': Transactions('2016-01-01 test1 10zł'),
+                    '02': Transactions('2016-02-01 test2 20zł\n2016-02-03 test1 30zł'),
+                }),
+                '2017': GroupedTransactions({
+                    '01': Transactions('2017-01-01 test2 40zł'),
+                }),
+            })
+        )
+
+    def test_group_by_is_same_as_chained_group(self):
+        transactions = Transactions("""
+2016-01-01 test1 10zł
+2016-02-01 test2 20zł
+2017-01-01 test1 40zł
+        """)
+        self.assertEqual(
+            str(transactions.group_by('year', 'month', 'test1')),
+            str(transactions.group('year').group('month').group('test1'))
+        )
+
+    def test_group_by_without_keys(self):
+        with self.assertRaisesRegex(ValueError, 'at least one key'):
+            Transactions('2016-01-01 test1 10zł').group_by()
+
     def test_parse_invalid_transaction(self):
         with self.assertRaises(TransactionParseError) as cm:
             Transactions('x')
@@ -116,6 +189,61 @@ class TransactionsTest(unittest.TestCase):
             Transactions('2016-01-01 10zł\nx')
         self.assertEqual(str(cm.exception), "can't parse 'x' as date from 'x' at line: 2")
 
+    def test_from_file(self):
+        fd, path = tempfile.mkstemp()
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write('2016-01-01 test 10zł\n# comment\n\n2016-01-02 test 20zł\n')
+        try:
+            self.assertEqual(
+                Transactions.from_file(path),
+                Transactions('2016-01-01 test 10zł\n2016-01-02 test 20zł')
+            )
+        finally:
+            os.remove(path)
+
+    def test_from_file_with_cache(self):
+        fd, path = tempfile.mkstemp()
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write('2016-01-01 test(a) 10zł\n2016-01-02 test 20zł + 1€\n')
+        try:
+            parsed = Transactions.from_file(path, cache=True)
+            self.assertTrue(os.path.exists(path + '.fincache'))
+            cached = Transactions.from_file(path, cache=True)
+            self.assertEqual([str(t) for t in cached], [str(t) for t in parsed])
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write('2016-01-03 test 30zł\n')
+            self.assertEqual(len(Transactions.from_file(path, cache=True)), 3)
+        finally:
+            os.remove(path)
+            os.remove(path + '.fincache')
+
+    def test_iter_transactions_is_lazy(self):
+        transactions = iter_transactions(io.StringIO('2016-01-01 test 10zł\nx\n'))
+        self.assertEqual(str(next(transactions)), '2016-01-01 test 10,00 zł')
+        with self.assertRaises(TransactionParseError) as cm:
+            next(transactions)
+        self.assertEqual(str(cm.exception), "can't parse 'x' as date from 'x' at line: 2")
+
+    def test_parse_in_parallel(self):
+        text = '\n'.join('2016-01-{:02d} test{} {}zł'.format(i % 28 + 1, i, i) for i in range(100))
+        self.assertEqual(
+            [str(t) for t in Transactions(text, workers=2)],
+            [str(t) for t in Transactions(text)]
+        )
+
+    def test_parse_in_parallel_keeps_order_of_chunks(self):
+        lines = ['2016-01-01 test{} 1zł'.format(i) for i in range(10)]
+        self.assertEqual(
+            [list(t.tags) for t in iter_transactions_in_parallel(lines, 2, chunk_size=3)],
+            [['test{}'.format(i)] for i in range(10)]
+        )
+
+    def test_parse_invalid_transaction_in_parallel(self):
+        lines = ['2016-01-01 10zł'] * 5 + ['x']
+        with self.assertRaises(TransactionParseError) as cm:
+            list(iter_transactions_in_parallel(lines, 2, chunk_size=2))
+        self.assertEqual(str(cm.exception), "can't parse 'x' as date from 'x' at line: 6")
+
     def test_sub(self):
         self.assertEqual(
             Transactions('2016-01-01 test 10zł') - Transactions('2016-01-02 test 10zł'),
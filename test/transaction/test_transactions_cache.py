@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import unittest
+import json
+import os
+import pickle
+import tempfile
+
+from fin.transaction import transactions_cache
+from fin.transaction.transactions_cache import load_cached_transactions
+
+
+class TransactionsCacheTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'expenses.txt')
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('2016-01-01 food(soup) shared 10zł\n2016-01-02 food 2,50€\n')
+        self.snapshot_path = self.path + transactions_cache.SNAPSHOT_SUFFIX
+
+    def load(self):
+        return [str(t) for t in load_cached_transactions(self.path)]
+
+    def test_snapshot_is_json(self):
+        parsed = self.load()
+        with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['strings'], ['food', 'shared', 'zł', '€'])
+        self.assertEqual(self.load(), parsed)
+
+    def test_hit_doesnt_hash_file(self):
+        parsed = self.load()
+        digest = transactions_cache.file_digest
+        transactions_cache.file_digest = None
+        try:
+            self.assertEqual(self.load(), parsed)
+        finally:
+            transactions_cache.file_digest = digest
+
+    def test_touched_file_is_hashed_once(self):
+        parsed = self.load()
+        os.utime(self.path, ns=(0, 0))
+        self.assertEqual(self.load(), parsed)
+        with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['key'][1], 0)
+
+    def test_pickle_isnt_loaded(self):
+        parsed = self.load()
+        with open(self.snapshot_path, 'wb') as f:
+            pickle.dump({'version': transactions_cache.SNAPSHOT_VERSION}, f)
+        self.assertEqual(self.load(), parsed)
+
+    def test_malformed_snapshot_is_replaced(self):
+        parsed = self.load()
+        with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+        snapshot['tags'] = [5, 5]
+        with open(self.snapshot_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f)
+        self.assertEqual(self.load(), parsed)
+        self.assertEqual(self.load(), parsed)
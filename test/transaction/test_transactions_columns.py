@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+import unittest
+from datetime import datetime
+
+from fin import GroupedTransactions
+from fin import Transactions
+from fin import TransactionsColumns
+from fin import Transaction
+from fin import Money
+from fin.intern import InternTable
+
+
+class TransactionsColumnsTest(unittest.TestCase):
+    def setUp(self):
+        self.transactions = Transactions([
+            Transaction('2016-01-01 test1(a) 10zł'),
+            Transaction(datetime(2016, 1, 2), {'test2': None}, Money('20zł + 1,50€')),
+            Transaction('2017-01-01 test1 test3 -5,25zł'),
+        ])
+        self.columns = TransactionsColumns(self.transactions)
+
+    def test_to_transactions(self):
+        self.assertEqual(
+            [str(t) for t in self.columns.to_transactions()],
+            [str(t) for t in self.transactions]
+        )
+
+    def test_eq(self):
+        self.assertEqual(self.columns, self.transactions)
+        self.assertEqual(self.columns, TransactionsColumns(str(self.transactions)))
+
+    def test_shares_empty_table_of_strings(self):
+        strings = InternTable()
+        columns = TransactionsColumns(self.transactions, strings)
+        self.assertIs(columns._strings, strings)
+        self.assertIn('test1', strings)
+
+    def test_len(self):
+        self.assertEqual(len(self.columns), 3)
+
+    def test_get_item(self):
+        self.assertEqual(str(self.columns[1]), '2016-01-02 test2 20,00 zł + 1,50 €')
+        self.assertEqual(str(self.columns[-1]), '2017-01-01 test1 test3 -5,25 zł')
+
+    def test_filter(self):
+        self.assertEqual(
+            self.columns.filter('test1'),
+            Transactions('2016-01-01 test1(a) 10zł\n2017-01-01 test1 test3 -5,25zł')
+        )
+        self.assertIsInstance(self.columns.filter('test1'), TransactionsColumns)
+
+    def test_sum(self):
+        self.assertEqual(self.columns.sum(), self.transactions.sum())
+        self.assertEqual(TransactionsColumns().sum(), Money())
+
+    def test_group(self):
+        self.assertEqual(
+            self.columns.group('year'),
+            GroupedTransactions({
+                '2016': Transactions(self.transactions[:2]),
+                '2017': Transactions('2017-01-01 test1 test3 -5,25zł'),
+            })
+        )
+        self.assertEqual(self.columns.group('year').sum(), self.transactions.group('year').sum())
+
+    def test_group_by_without_keys(self):
+        with self.assertRaises(ValueError):
+            self.columns.group_by()
+
+    def test_map(self):
+        self.assertEqual(
+            self.columns.map(lambda t: Transaction(t.date, t.tags, t.money * 2)),
+            self.transactions.map(lambda t: Transaction(t.date, t.tags, t.money * 2))
+        )
+
+    def test_add(self):
+        self.assertEqual(
+            self.columns + TransactionsColumns('2018-01-01 test4 1zł'),
+            self.transactions + Transactions('2018-01-01 test4 1zł')
+        )
+
+    def test_merge(self):
+        self.assertEqual(self.columns.merge(), self.transactions.merge())
+
+
+if __name__ == '__main__':
+    unittest.main()
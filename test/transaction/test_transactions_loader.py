@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+import unittest
+import os
+import tempfile
+
+from fin import TransactionsLoader
+from fin import Transactions
+from fin import TransactionParseError
+
+
+class TransactionsLoaderTest(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+        self.write('2016-01-01 test1 10zł\n2016-01-02 test2 20zł\n')
+        self.loader = TransactionsLoader(self.path)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def write(self, text, mode='w'):
+        with open(self.path, mode, encoding='utf-8') as f:
+            f.write(text)
+
+    def test_load(self):
+        self.assertEqual(
+            self.loader.load(),
+            Transactions('2016-01-01 test1 10zł\n2016-01-02 test2 20zł')
+        )
+        self.assertEqual(self.loader.line_count, 2)
+
+    def test_load_appended_lines(self):
+        self.loader.load()
+        offset = self.loader.offset
+        self.write('# comment\n2016-01-03 test3 30zł\n', 'a')
+        self.assertEqual(
+            self.loader.load(),
+            Transactions('2016-01-01 test1 10zł\n2016-01-02 test2 20zł\n2016-01-03 test3 30zł')
+        )
+        self.assertEqual(self.loader.line_count, 4)
+        self.assertEqual(self.loader.offset, os.path.getsize(self.path))
+        self.assertTrue(self.loader.offset > offset)
+
+    def test_skip_unterminated_line(self):
+        self.write('2016-01-03 test3 3', 'a')
+        self.assertEqual(len(self.loader.load()), 2)
+        self.write('0zł\n', 'a')
+        self.assertEqual(str(self.loader.load()[2]), '2016-01-03 test3 30,00 zł')
+
+    def test_load_last_line_without_newline(self):
+        self.write('2016-01-03 test3 30zł', 'a')
+        self.assertEqual(len(self.loader.load()), len(Transactions.from_file(self.path)))
+        self.assertEqual(self.loader.line_count, 2)
+        self.write('\n2016-01-04 test4 40zł\n', 'a')
+        self.assertEqual(
+            [str(t) for t in self.loader.load()[2:]],
+            ['2016-01-03 test3 30,00 zł', '2016-01-04 test4 40,00 zł']
+        )
+
+    def test_load_extends_transactions_in_place(self):
+        transactions = self.loader.load()
+        self.write('2016-01-03 test3 30zł\n', 'a')
+        self.assertIs(self.loader.load(), transactions)
+        self.assertEqual(len(transactions), 3)
+
+    def test_reload_truncated_file(self):
+        self.loader.load()
+        self.write('2016-01-05 test5 50zł\n')
+        self.assertEqual(self.loader.load(), Transactions('2016-01-05 test5 50zł'))
+
+    def test_reload_rewritten_file(self):
+        self.loader.load()
+        self.write('2016-01-01 test1 10zł\n2016-01-02 test9 20zł\n2016-01-03 test3 30zł\n')
+        self.assertEqual(
+            self.loader.load(),
+            Transactions('2016-01-01 test1 10zł\n2016-01-02 test9 20zł\n2016-01-03 test3 30zł')
+        )
+
+    def test_error_in_appended_line(self):
+        self.loader.load()
+        self.write('x\n', 'a')
+        with self.assertRaises(TransactionParseError) as cm:
+            self.loader.load()
+        self.assertEqual(str(cm.exception), "can't parse 'x' as date from 'x' at line: 3")
+        self.assertEqual(self.loader.line_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()